@@ -245,6 +245,24 @@ class JiraSQLiteCache:
 
         conn.commit()
 
+    def prune_expired(self, category: str) -> int:
+        """
+        Delete a category's entries whose TTL has passed.
+
+        Returns:
+            Number of entries deleted
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            DELETE FROM metadata
+            WHERE category = ? AND cached_at + ttl < ?
+        ''', (category, time.time()))
+
+        conn.commit()
+        return cursor.rowcount
+
     def clear_all(self):
         """
         Clear all cached data for this Jira instance.
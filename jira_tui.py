@@ -7,18 +7,28 @@ Provides a split-pane interface with vim keybindings for browsing tickets
 
 import json
 import os
+import queue
+import shlex
+import shutil
 import sys
 import subprocess
 import webbrowser
 import textwrap
 import threading
 import signal
+import tempfile
 import atexit
+import configparser
 import re
+import select
 import time
 from urllib.parse import quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional, Sequence, Tuple
 from pathlib import Path
 
 # Try to import curses, gracefully handle if not available
@@ -29,10 +39,255 @@ except ImportError:
     CURSES_AVAILABLE = False
     print("⚠️  curses not available - falling back to basic mode", file=sys.stderr)
 
+# ANSI color/control escape sequences (compiled once, used by _strip_ansi)
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# One-character strings for ASCII codes, so keystrokes don't allocate via chr()
+_CHR128 = tuple(chr(i) for i in range(128))
+
+# "[L]" indicator for every letter JiraUtils.get_status_letter can return ('?' = unmapped)
+_STATUS_TAGS = {letter: f"[{letter}]" for letter in "BASWTPRQCVYMZDX_?"}
+
+# Any whitespace textwrap could break on (used to spot unbreakable tokens like URLs)
+_WHITESPACE_RE = re.compile(r'\s')
+
+# A bare issue key typed where JQL is expected (case-insensitive)
+_ISSUE_KEY_RE = re.compile(r'^[A-Za-z][A-Za-z0-9]+-\d+$')
+
+# Project hints in a query, used by _extract_project_from_query
+_TICKET_PROJECT_RE = re.compile(r'^([A-Z]+)-\d+')
+_PROJECT_EQ_RE = re.compile(r'project\s*=\s*["\']?([A-Z]+)["\']?', re.IGNORECASE)
+_PROJECT_IN_RE = re.compile(r'project\s+IN\s*\(\s*([A-Z, ]+)\)', re.IGNORECASE)
+
+# Inline markup recognized by _parse_inline_text. Order matters! Markdown links
+# [text](url) first, then @mentions (word characters, spaces, dots, hyphens), then bare URLs
+_INLINE_MARKUP_RE = re.compile(
+    r'(\[([^\]]+)\]\(([^\)]+)\))'
+    r'|(@([\w\s\.\-]+?)(?=\s|$|[,\.](?:\s|$)))'
+    r'|(https?://[^\s\)]+)'
+)
+
+
+@lru_cache(maxsize=None)
+def _get_text_wrapper(width: int) -> textwrap.TextWrapper:
+    """Get the TextWrapper for a width (it compiles its regexes on construction)."""
+    return textwrap.TextWrapper(width=width, break_long_words=True, break_on_hyphens=False)
+
+
+# Whitespace TextWrapper turns into spaces before splitting (replace_whitespace=True)
+_WRAP_WHITESPACE = str.maketrans('\t\n\x0b\x0c\r', '     ')
+
+# (leading spaces, word) pairs of a wrapped paragraph
+_WRAP_WORD_RE = re.compile(r'( *)([^ ]+)')
+
+
+def _wrap_optimal(text: str, width: int) -> Optional[Tuple[str, ...]]:
+    """
+    Word-wrap text with minimum raggedness (Knuth-Plass style optimal fit).
+
+    Chooses the breaks that minimize the sum of squared trailing gaps over all
+    lines but the last, instead of filling each line greedily. Splits words and
+    keeps spacing the way TextWrapper does: inner whitespace runs are kept,
+    whitespace at a break is dropped, and the paragraph's indentation stays
+    on the first line.
+
+    Returns:
+        The wrapped lines, or None when greedy filling would take fewer than
+        three lines or a word is wider than width - those are
+        left to TextWrapper
+    """
+    pairs = _WRAP_WORD_RE.findall(text.expandtabs().translate(_WRAP_WHITESPACE))
+    count = len(pairs)
+    if count < 3 or len(pairs[0][0]) + len(pairs[0][1]) > width:
+        return None
+
+    # ends[j] = width of words 0..j-1 with their leading spaces; starts_at[k] = where
+    # a line beginning at word k starts, its leading spaces dropped (kept for the
+    # first line). Words k..j-1 on one line then span ends[j] - starts_at[k].
+    ends = [0]
+    starts_at = []
+    for spaces, word in pairs:
+        if len(word) > width:
+            return None
+        starts_at.append(ends[-1] + len(spaces))
+        ends.append(starts_at[-1] + len(word))
+    starts_at[0] = 0
+
+    # Greedy fill first: short paragraphs keep TextWrapper's layout
+    lines_needed = 0
+    k = 0
+    while k < count and lines_needed < 3:
+        j = k + 1
+        while j < count and ends[j + 1] - starts_at[k] <= width:
+            j += 1
+        lines_needed += 1
+        k = j
+    if lines_needed < 3:
+        return None
+
+    # best[j] = least cost of setting words 0..j-1; breaks[j] = first word of its
+    # last line. first is the earliest word a line ending at word j-1 can start
+    # with; it only moves forward as j grows. Ties go to the latest start.
+    best = [0] * (count + 1)
+    breaks = [0] * (count + 1)
+    first = 0
+    for j in range(1, count + 1):
+        end = ends[j]
+        while end - starts_at[first] > width:
+            first += 1
+        slack = width - end
+        last_line = j == count
+        best_cost = -1
+        for k in range(j - 1, first - 1, -1):
+            if last_line:
+                cost = best[k]
+            else:
+                gap = slack + starts_at[k]
+                cost = best[k] + gap * gap
+            if best_cost < 0 or cost < best_cost:
+                best_cost = cost
+                breaks[j] = k
+        best[j] = best_cost
+
+    lines = []
+    j = count
+    while j:
+        k = breaks[j]
+        lines.append(''.join(spaces + word for spaces, word in pairs[k:j])[starts_at[k] - ends[k]:])
+        j = k
+    lines.reverse()
+    return tuple(lines)
+
+
+@lru_cache(maxsize=4096)
+def _wrap_cached(text: str, width: int) -> Tuple[str, ...]:
+    """
+    Word-wrap text to width. Pure, so identical descriptions/comments wrap once across redraws.
+
+    Paragraphs of three or more lines are broken with _wrap_optimal for an even
+    right edge; shorter ones (and text with words wider than the pane) keep
+    TextWrapper's greedy fill.
+    """
+    balanced = _wrap_optimal(text, width)
+    if balanced is not None:
+        return balanced
+    return tuple(_get_text_wrapper(width).wrap(text))
+
+
+def _wrap_line(text: str, width: int) -> Tuple[str, ...]:
+    """
+    Word-wrap one line of a comment or history entry (same result as _wrap_cached).
+
+    Most such lines already fit. When one also has nothing TextWrapper would
+    rewrite (tabs and other control whitespace, trailing spaces, blank lines)
+    it is returned as is, without tokenizing it or taking a _wrap_cached slot
+    from the long paragraphs that need one.
+    """
+    if len(text) <= width and text.isprintable() and text and text[-1] != ' ':
+        return (text,)
+    return _wrap_cached(text, width)
+
+
+class _PaneRecorder:
+    """
+    Stand-in for a pane window that records draw calls as rows of segments.
+
+    The pane draw methods write to it exactly as they would to the window;
+    JiraTUI._paint_pane then repaints only the rows that differ from the
+    previous frame, so unchanged rows cost no curses calls at all.
+    """
+
+    __slots__ = ('encoding', 'rows')
+
+    def __init__(self, win):
+        self.encoding = win.encoding
+        self.rows = {}  # y -> [(x, text, attr), ...]; chgat records a cell count as text
+
+    def addstr(self, y: int, x: int, text, attr: int = 0) -> None:
+        self.rows.setdefault(y, []).append((x, text, attr))
+
+    def chgat(self, y: int, x: int, num: int, attr: int) -> None:
+        self.rows.setdefault(y, []).append((x, num, attr))
+
 
 class JiraTUI:
     """Interactive Terminal UI for Jira ticket viewing with vim keybindings."""
 
+    # Help overlay content and box geometry (static, computed once at class definition)
+    _HELP_TEXT = (
+        "JIRA-VIEW INTERACTIVE MODE - HELP",
+        "",
+        "Navigation:",
+        "  j / ↓      Move down in list",
+        "  k / ↑      Move up in list",
+        "  g          Jump to top",
+        "  G          Jump to bottom",
+        "  Enter      Scroll detail pane down (1 line)",
+        "  \\          Scroll detail pane up (1 line)",
+        "  Ctrl+J     Scroll detail pane down (1 line)",
+        "  Ctrl+K     Scroll detail pane up (1 line)",
+        "  Ctrl+B     Scroll detail pane down (half-page)",
+        "  Ctrl+U     Scroll detail pane up (half-page)",
+        "",
+        "Actions:",
+        "  r          Refresh current view",
+        "  R          Refresh cache (link types, users)",
+        "  e          Edit ticket",
+        "  w          Edit story points (weight)",
+        "  f          Toggle flags",
+        "  F          Toggle full mode (all comments)",
+        "  b          Toggle backlog mode (rank ordering)",
+        "  v          Open ticket in browser",
+        "  y          Copy ticket URL to clipboard (yank)",
+        "  t          Transition ticket",
+        "  c          Add comment to ticket",
+        "  l          Manage issue links",
+        "  n          Create new issue",
+        "  d          Select saved dashboard",
+        "  s          New default query (JQL or ticket key)",
+        "  S          Edit default query (Ctrl+X: open in editor)",
+        "  /          Search/filter tickets",
+        "  ?          Show this help",
+        "  q          Quit",
+        "",
+        "Backlog Mode (press 'b' to toggle):",
+        "  mN         Move up N positions (e.g., m3)",
+        "  MN         Move down N positions (e.g., M2)",
+        "  mm / m0    Move to top",
+        "  MM         Move to bottom",
+        "",
+        "Press any key to close help",
+    )
+    _HELP_BOX_WIDTH = max(len(line) for line in _HELP_TEXT) + 4
+    _HELP_BOX_HEIGHT = len(_HELP_TEXT) + 2
+
+    # Synchronized output (DECSET 2026): the terminal holds a frame until it is complete,
+    # so it never shows a half-drawn one. Terminals without support ignore the mode.
+    _SYNC_BEGIN = b'\x1b[?2026h'
+    _SYNC_END = b'\x1b[?2026l'
+
+    # Color pair per status letter: green done, blue backlog, yellow active, red blocked
+    _STATUS_COLOR_PAIRS = {
+        'C': 1, 'V': 1, 'Z': 1, 'Y': 1, 'M': 1,
+        'A': 3, 'B': 3, 'S': 3, 'W': 3,
+        'P': 2, 'R': 2, 'Q': 2, 'T': 2,
+        'D': 4, 'X': 4, '_': 4,
+    }
+
+    # Detail-pane layouts kept by _get_detail_lines (one per ticket/mode/width)
+    _DETAIL_CACHE_SIZE = 128
+
+    # Keys that only scroll the detail pane (Enter/Ctrl+J, Ctrl+K, \\, Ctrl+B, Ctrl+U)
+    _DETAIL_SCROLL_KEYS = frozenset((10, 11, ord('\\'), 2, 21))
+
+    # Ticket count above which search filtering scans one joined text instead of per-ticket tests
+    _SEARCH_SCAN_MIN_TICKETS = 2000
+
+    # Status bar mode indicators and key hints (static)
+    _STATUS_MODE_BACKLOG = " [BACKLOG: mN↑ MN↓ mm⭡ MM⭣ b=exit]"
+    _STATUS_MODE_NORMAL = " [NORMAL]"
+    _STATUS_RIGHT = " q:quit j/k:move <n>j/k:<n> gg/G:top/bot <n>gg:line r:refresh e:edit t:transition f:flags c:comment w:weight v:browser ?:help "
+
     def __init__(self, viewer, use_colors: bool):
         """Initialize TUI with reference to JiraViewer instance."""
         self.viewer = viewer
@@ -55,6 +310,7 @@ class JiraTUI:
         self.detail_total_lines = 0  # Track total lines in right pane
         self.curses_initialized = False  # Track if curses is active
         self._original_sigint_handler = None  # Store original signal handler
+        self._original_sigwinch_handler = None  # Set while our resize handler is installed
         self._shutdown_flag = False  # Flag to signal background threads to stop
         self.backlog_mode = False  # Track if in backlog mode (for rank reordering)
 
@@ -70,8 +326,42 @@ class JiraTUI:
         self.loading_complete = False  # Track if background loading is done (migrate to QueryController)
         self.loading_count = 0  # Track how many tickets loaded (migrate to QueryController)
         self.loading_total = 0  # Track total tickets to load (migrate to QueryController)
-        self.loading_lock = threading.Lock()  # Thread-safe cache updates (migrate to QueryController)
+        self.loading_lock = threading.Lock()  # Protects ticket_cache mutations only (migrate to QueryController)
+        self._loaded_keys = queue.SimpleQueue()  # Keys finished by background loaders, drained by the UI loop
+        self._wake_r = self._wake_w = None  # Self-pipe waking the UI loop's select() (created in _curses_main)
         self.stale_tickets = set()  # Track tickets that may no longer match (migrate to QueryController)
+        self._prefetch_executor = None  # Small pool warming neighbor tickets between keys (created in _curses_main)
+        # Shared pool for background ticket/transition fetches (threads start lazily, reused across refreshes)
+        self._io_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix='jira_tui')
+        atexit.register(self._io_pool.shutdown, wait=False)
+        self._pending_prefetch = {}  # ticket_key -> Future for prefetches not yet collected by the UI loop
+
+        # Rendering caches
+        self._last_loading_indicator = ""  # Loading text last drawn in the status bar
+        self._status_cache_key = None  # (status_left, width) of the last rendered status line
+        self._status_cache_str = ""  # Last rendered status line
+        self._help_win = None  # Help popup window, composed once per terminal size
+        self._help_geometry = None  # (height, width) the help popup was composed for
+        self._search_scan = None  # (indexed list, its tickets, joined search text, start offsets) for _scan_tickets
+        self.list_win = None  # Left pane window (recreated when the terminal size changes)
+        self.detail_win = None  # Right pane window (recreated when the terminal size changes)
+        self._pane_geometry = None  # (height, width) the pane windows were created for
+        self._list_frame = {}  # Rows last painted into list_win (y -> segments), see _paint_pane
+        self._detail_frame = {}  # Rows last painted into detail_win
+        self._tag_attrs = {}  # Detail-line tag -> curses attr, filled by _get_tag_attr
+        self._legend_cache = {}  # max_width -> packed legend lines, see _pack_legend
+        self._detail_lines_cache = OrderedDict()  # (ticket_key, show_full, width) -> [ticket, lines laid out so far, generator for the rest or None], LRU order
+
+        # External programs, resolved once so the first use doesn't stall the UI
+        try:
+            self._browser = webbrowser.get()  # Only registers/looks up; doesn't launch anything
+        except webbrowser.Error:
+            self._browser = None  # No usable browser (e.g. headless session); v does nothing
+        self._editor = shlex.split(os.environ.get('EDITOR', '')) or ['vim']
+        self._scratch_dir = None  # Per-session directory for editor scratch files (created on first use)
+
+        # Ticket browse URL prefix (Jira URL from environment, fallback to default)
+        self._jira_browse_base = os.environ.get('JIRA_URL', 'https://indeed.atlassian.net') + '/browse/'
 
     @staticmethod
     def normalize_jql_input(input_str: str) -> str:
@@ -87,8 +377,7 @@ class JiraTUI:
         stripped = input_str.strip()
 
         # Check if input looks like a plain issue key (case-insensitive)
-        issue_key_pattern = r'^[A-Za-z][A-Za-z0-9]+-\d+$'
-        if re.match(issue_key_pattern, stripped):
+        if _ISSUE_KEY_RE.match(stripped):
             # Convert to uppercase and wrap in key= JQL
             return f'key={stripped.upper()}'
 
@@ -114,8 +403,6 @@ class JiraTUI:
 
     def _load_dashboards(self):
         """Load saved dashboards from teams.conf file."""
-        import configparser
-
         config_file = self.viewer.script_dir / "teams.conf"
         if not config_file.exists():
             return  # No config file, no dashboards
@@ -182,7 +469,14 @@ class JiraTUI:
             # Restore original signal handler
             if self._original_sigint_handler:
                 signal.signal(signal.SIGINT, self._original_sigint_handler)
+            if self._original_sigwinch_handler is not None:
+                signal.signal(signal.SIGWINCH, self._original_sigwinch_handler)
+                self._original_sigwinch_handler = None
             atexit.unregister(self._cleanup_curses)
+            if self._wake_r is not None:
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._wake_r = self._wake_w = None
 
     def _run_fallback(self, query_or_ticket: str) -> int:
         """Fallback mode when curses is not available - show first ticket."""
@@ -226,7 +520,17 @@ class JiraTUI:
 
         # Initialize curses
         curses.curs_set(0)  # Hide cursor
-        stdscr.timeout(100)  # Non-blocking input with 100ms timeout
+        stdscr.timeout(100)  # Dialog getch() polls; the main loop blocks in _wait_for_input
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        if hasattr(signal, 'SIGWINCH'):
+            # select() isn't interrupted by curses' own resize handling, so route
+            # SIGWINCH through the wake pipe; _wait_for_input applies the resize
+            previous = signal.signal(signal.SIGWINCH, lambda signum, frame: self._wake_ui())
+            # None means a handler installed outside Python; SIG_DFL is the closest restore
+            self._original_sigwinch_handler = previous if previous is not None else signal.SIG_DFL
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2)
 
         # Setup colors if terminal supports it
         if curses.has_colors():
@@ -259,7 +563,7 @@ class JiraTUI:
         # Note: The "Counting tickets..." display happens inside fetch_all_jql_results via stdscr
         def progress_callback(fetched, total):
             """Update screen with fetch progress."""
-            stdscr.clear()
+            stdscr.erase()
             stdscr.addstr(0, 0, f"Loading tickets: {fetched}/{total}...")
             stdscr.refresh()
 
@@ -273,19 +577,9 @@ class JiraTUI:
             return 0
 
         # Cache all tickets immediately (we already have full data from JQL query)
-        stdscr.addstr(0, 0, "Loading tickets...")
-        stdscr.refresh()
+        self._set_status(stdscr, "Loading tickets...")
 
-        with self.loading_lock:
-            for ticket in tickets:
-                ticket_key = ticket.get('key')
-                if ticket_key:
-                    # Store the full ticket data (already includes all fields from JQL query)
-                    self.ticket_cache[ticket_key] = ticket
-
-            self.loading_count = len(tickets)
-            self.loading_total = len(tickets)
-            self.loading_complete = True
+        self._reset_cache_with_tickets(tickets)
 
         # Start background threads (non-blocking - UI will appear immediately)
         if tickets:
@@ -313,67 +607,141 @@ class JiraTUI:
         search_query = ""
         show_help = False
         input_buffer = ""  # Shows what user is typing (for number prefixes)
+        needs_redraw = True  # Full redraw only after input; idle ticks just poll loading progress
+        detail_dirty = False  # Only the detail pane changed (detail scrolling)
+        status_dirty = False  # Only the status bar changed (loading progress)
+        details_pending = False  # True while the detail pane shows the loading placeholder
+        chrome_dirty = True  # stdscr (separator) must be rebuilt: start, resize, help, dialogs
+        # Keys that only move the selection or detail scroll (no-ops when nothing moved)
+        navigation_keys = self._DETAIL_SCROLL_KEYS | {
+            ord('j'), ord('k'), curses.KEY_DOWN, curses.KEY_UP, ord('g'), ord('G')
+        }
 
         while True:
             # Get terminal dimensions
             height, width = stdscr.getmaxyx()
 
-            # Use erase() instead of clear() - doesn't flash as much
-            stdscr.erase()
-
             # Show help overlay if requested
             if show_help:
-                self._draw_help(stdscr, height, width)
-                stdscr.noutrefresh()
-                curses.doupdate()
-                key = stdscr.getch()
+                if needs_redraw:
+                    # Popup over the panes: composed once, then just flushed
+                    self._show_help(height, width)
+                    self._flush_frame()
+                    needs_redraw = False
+                key = self._wait_for_input(stdscr)
                 if key != -1:  # Any key dismisses help
                     show_help = False
+                    needs_redraw = chrome_dirty = True
                 continue
 
+            if not needs_redraw:
+                loaded_keys = self._drain_loaded_keys()
+                indicator_changed = self._get_loading_indicator() != self._last_loading_indicator
+                selected_key = tickets[selected_idx].get('key') if tickets and selected_idx < len(tickets) else None
+
+                if details_pending and (selected_key in loaded_keys or indicator_changed):
+                    # Selected ticket finished loading (or loading ended) - repaint everything
+                    needs_redraw = True
+                elif indicator_changed:
+                    # Only the loading counter ticked - repaint just the status bar
+                    status_dirty = True
+
             # Calculate pane dimensions (1/5 to 1/4 of screen width)
             list_width = max(width // 5, min(width // 4, 70))
             detail_x = list_width + 1
             detail_width = width - detail_x
 
-            # Draw vertical separator
-            for y in range(height - 1):
-                try:
-                    stdscr.addch(y, list_width, curses.ACS_VLINE)
-                except curses.error:
-                    pass
+            # Each pane is its own window so it can be repainted and flushed independently
+            if self._pane_geometry != (height, width):
+                pane_height = max(1, height - 1)
+                self.list_win = curses.newwin(pane_height, max(1, list_width), 0, 0)
+                self.detail_win = curses.newwin(pane_height, max(1, detail_width), 0, detail_x)
+                self._pane_geometry = (height, width)
+                self._list_frame = {}
+                self._detail_frame = {}
+                needs_redraw = chrome_dirty = True
+
+            if needs_redraw:
+                if chrome_dirty:
+                    # Dialogs may have covered the panes on screen: resend them in full
+                    # (the window contents themselves are still current)
+                    self.list_win.touchwin()
+                    self.detail_win.touchwin()
+
+                    # Use erase() instead of clear() - doesn't flash as much
+                    stdscr.erase()
+
+                    # Draw vertical separator (static until resize or a dialog draws over it)
+                    for y in range(height - 1):
+                        try:
+                            stdscr.addch(y, list_width, curses.ACS_VLINE)
+                        except curses.error:
+                            pass
+                    chrome_dirty = False
 
-            # Draw ticket list in left pane
-            # Show original query if in backlog mode (current_query has ORDER BY Rank appended)
-            display_query = self.original_query if self.backlog_mode and self.original_query else current_query
-            self._draw_ticket_list(stdscr, tickets, selected_idx, scroll_offset,
-                                   height - 2, list_width, search_query, display_query)
+                # Draw status bar at bottom (overwrites its whole row)
+                self._draw_status_bar(stdscr, height - 1, width, selected_idx + 1,
+                                     len(tickets), search_query, input_buffer)
+                stdscr.noutrefresh()
 
-            # Draw ticket details in right pane
-            if tickets and selected_idx < len(tickets):
-                current_ticket_key = tickets[selected_idx].get('key')
-                self._draw_ticket_details(stdscr, current_ticket_key, detail_x,
-                                         height - 2, detail_width)
+                # Draw ticket list in left pane
+                # Show original query if in backlog mode (current_query has ORDER BY Rank appended)
+                display_query = self.original_query if self.backlog_mode and self.original_query else current_query
+                frame = _PaneRecorder(self.list_win)
+                self._draw_ticket_list(frame, tickets, selected_idx, scroll_offset,
+                                       height - 2, list_width, search_query, display_query)
+                self._list_frame = self._paint_pane(self.list_win, frame.rows, self._list_frame)
+                self.list_win.noutrefresh()
+
+                # Draw ticket details in right pane
+                detail_dirty = True
+
+            if detail_dirty:
+                details_pending = False
+                frame = _PaneRecorder(self.detail_win)
+                if tickets and selected_idx < len(tickets):
+                    current_ticket_key = tickets[selected_idx].get('key')
+                    details_pending = current_ticket_key not in self.ticket_cache
+                    self._draw_ticket_details(frame, current_ticket_key, 0,
+                                             height - 2, detail_width)
+                self._detail_frame = self._paint_pane(self.detail_win, frame.rows, self._detail_frame)
+                self.detail_win.noutrefresh()
+
+            if status_dirty and not needs_redraw:
+                self._draw_status_bar(stdscr, height - 1, width, selected_idx + 1,
+                                     len(tickets), search_query, input_buffer)
+                stdscr.noutrefresh()
 
-            # Draw status bar at bottom
-            self._draw_status_bar(stdscr, height - 1, width, selected_idx + 1,
-                                 len(tickets), search_query, input_buffer)
+            if needs_redraw or detail_dirty or status_dirty:
+                # Flush every pane's changes to the terminal in one update (no flashing)
+                self._flush_frame()
+                needs_redraw = detail_dirty = status_dirty = False
 
-            # Use noutrefresh() + doupdate() for atomic update (no flashing)
-            stdscr.noutrefresh()
-            curses.doupdate()
+            # Warm the cache around the selection while waiting for the next key
+            self._prefetch_neighbors(tickets, selected_idx)
 
-            # Handle input
-            key = stdscr.getch()
+            # Handle input (sleeps until a key, a background signal or a resize)
+            key = self._wait_for_input(stdscr)
 
-            if key == -1:  # No input (timeout)
+            if key == -1:  # Woken by a background loader - repaint checks run at the top
                 continue
-            elif key == ord('q'):  # Quit
+
+            if key in self._DETAIL_SCROLL_KEYS:
+                detail_dirty = True  # Scrolling the detail pane leaves list and status untouched
+            else:
+                needs_redraw = True
+            nav_state = (selected_idx, scroll_offset, self.detail_scroll_offset)
+
+            if key == ord('q'):  # Quit
                 self._shutdown_flag = True
+                self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+                self._io_pool.shutdown(wait=False, cancel_futures=True)
                 break
             elif key == ord('j') or key == curses.KEY_DOWN:  # Down
+                # Apply held-key repeats already queued in one step (one redraw)
+                steps = 1 + self._count_queued_repeats(stdscr, (ord('j'), curses.KEY_DOWN))
                 if selected_idx < len(tickets) - 1:
-                    selected_idx += 1
+                    selected_idx = min(selected_idx + steps, len(tickets) - 1)
                     # Auto-scroll if needed
                     visible_height = self._get_visible_height(height)
                     if selected_idx >= scroll_offset + visible_height:
@@ -381,8 +749,9 @@ class JiraTUI:
                     # Reset detail scroll when changing tickets
                     self.detail_scroll_offset = 0
             elif key == ord('k') or key == curses.KEY_UP:  # Up
+                steps = 1 + self._count_queued_repeats(stdscr, (ord('k'), curses.KEY_UP))
                 if selected_idx > 0:
-                    selected_idx -= 1
+                    selected_idx = max(selected_idx - steps, 0)
                     # Auto-scroll if needed
                     if selected_idx < scroll_offset:
                         scroll_offset = selected_idx
@@ -467,6 +836,9 @@ class JiraTUI:
                 # Remember currently selected ticket
                 current_ticket_key = tickets[selected_idx].get('key') if tickets and selected_idx < len(tickets) else None
 
+                # Drop memoized API responses (current user, user search) with the tickets
+                self.viewer.utils.clear_cache()
+
                 # current_query is already modified in backlog mode (has ORDER BY Rank)
                 all_tickets, _ = self._fetch_tickets(current_query, stdscr=stdscr)
 
@@ -496,22 +868,11 @@ class JiraTUI:
                 elif selected_idx >= scroll_offset + visible_height:
                     scroll_offset = selected_idx - visible_height + 1
 
-                # Clear cache and cache all tickets immediately
-                stdscr.addstr(0, 0, "Refreshing tickets...")
-                stdscr.refresh()
-
-                self.ticket_cache.clear()
-                with self.loading_lock:
-                    for ticket in all_tickets:
-                        ticket_key = ticket.get('key')
-                        if ticket_key:
-                            self.ticket_cache[ticket_key] = ticket
-                    self.loading_count = len(all_tickets)
-                    self.loading_total = len(all_tickets)
-                    self.loading_complete = True
+                # Clear cache and cache all tickets immediately (transitions are kept
+                # until the background reload replaces them)
+                self._set_status(stdscr, "Refreshing tickets...")
 
-                # Clear stale tickets after refresh
-                self.stale_tickets.clear()
+                self._reset_cache_with_tickets(all_tickets, clear_transitions=False)
 
                 # Reload transitions in background
                 if all_tickets:
@@ -651,11 +1012,11 @@ class JiraTUI:
                 # Remember current ticket key before filtering
                 current_ticket_key = tickets[selected_idx].get('key') if tickets and selected_idx < len(tickets) else None
 
-                search_query = self._get_search_input(stdscr, height - 1, width)
+                search_query, filtered_tickets = self._get_search_input(stdscr, height - 1, width, all_tickets)
 
-                # Filter tickets by search query or restore full list if empty
+                # Use the filtered tickets or restore full list if empty
                 if search_query:
-                    tickets = self._filter_tickets(all_tickets, search_query)
+                    tickets = filtered_tickets
                     # Tickets should already be in rank order if in backlog mode
                     # (since all_tickets was fetched with ORDER BY Rank)
                     selected_idx = 0
@@ -776,11 +1137,8 @@ class JiraTUI:
                 if new_ticket_key:
                     # Switch to viewing the new ticket
                     new_query = new_ticket_key
-                    stdscr.addstr(0, 0, f"Loading {new_ticket_key}...")
-                    stdscr.refresh()
-
                     try:
-                        tickets, single_ticket_mode = self._fetch_tickets(new_query, stdscr=stdscr)
+                        tickets = self._apply_new_query(stdscr, new_query, f"Loading {new_ticket_key}...")
                         if tickets:
                             # Reset state
                             current_query = new_query
@@ -788,25 +1146,6 @@ class JiraTUI:
                             selected_idx = 0
                             scroll_offset = 0
                             search_query = ""
-
-                            # Clear caches and stale tickets
-                            self.ticket_cache.clear()
-                            self.transitions_cache.clear()
-                            self.stale_tickets.clear()
-
-                            # Cache all tickets immediately
-                            with self.loading_lock:
-                                for ticket in tickets:
-                                    ticket_key = ticket.get('key')
-                                    if ticket_key:
-                                        self.ticket_cache[ticket_key] = ticket
-                                self.loading_count = len(tickets)
-                                self.loading_total = len(tickets)
-                                self.loading_complete = True
-
-                            # Restart background transition loading
-                            thread = threading.Thread(target=self._load_transitions_background, args=(tickets,), daemon=True)
-                            thread.start()
                     except Exception as e:
                         self._show_message(stdscr, f"✗ Error loading new ticket: {str(e)}", height, width)
             elif key == ord('w') or key == ord('W'):  # Weight (story points)
@@ -833,11 +1172,8 @@ class JiraTUI:
                 if result:
                     new_query, dashboard_name = result
                     # Re-fetch tickets with selected query/dashboard
-                    stdscr.addstr(0, 0, "Loading tickets...")
-                    stdscr.refresh()
-
                     try:
-                        tickets, single_ticket_mode = self._fetch_tickets(new_query, stdscr=stdscr)
+                        tickets = self._apply_new_query(stdscr, new_query)
                         if tickets:
                             # Reset state
                             current_query = new_query
@@ -847,25 +1183,6 @@ class JiraTUI:
                             scroll_offset = 0
                             search_query = ""
 
-                            # Clear caches and stale tickets
-                            self.ticket_cache.clear()
-                            self.transitions_cache.clear()
-                            self.stale_tickets.clear()
-
-                            # Cache all tickets immediately
-                            with self.loading_lock:
-                                for ticket in tickets:
-                                    ticket_key = ticket.get('key')
-                                    if ticket_key:
-                                        self.ticket_cache[ticket_key] = ticket
-                                self.loading_count = len(tickets)
-                                self.loading_total = len(tickets)
-                                self.loading_complete = True
-
-                            # Restart background transition loading
-                            thread = threading.Thread(target=self._load_transitions_background, args=(tickets,), daemon=True)
-                            thread.start()
-
                             dash_label = "Default" if dashboard_name is None else dashboard_name
                             self._show_message(stdscr, f"✓ Loaded {len(tickets)} tickets ({dash_label})", height, width)
                         else:
@@ -883,11 +1200,8 @@ class JiraTUI:
                     self.current_dashboard_name = None  # Switch to default
 
                     # Re-fetch tickets with new query
-                    stdscr.addstr(0, 0, "Loading tickets...")
-                    stdscr.refresh()
-
                     try:
-                        tickets, single_ticket_mode = self._fetch_tickets(new_query, stdscr=stdscr)
+                        tickets = self._apply_new_query(stdscr, new_query)
                         if tickets:
                             # Reset state
                             current_query = new_query
@@ -896,25 +1210,6 @@ class JiraTUI:
                             scroll_offset = 0
                             search_query = ""
 
-                            # Clear caches and stale tickets
-                            self.ticket_cache.clear()
-                            self.transitions_cache.clear()
-                            self.stale_tickets.clear()
-
-                            # Cache all tickets immediately
-                            with self.loading_lock:
-                                for ticket in tickets:
-                                    ticket_key = ticket.get('key')
-                                    if ticket_key:
-                                        self.ticket_cache[ticket_key] = ticket
-                                self.loading_count = len(tickets)
-                                self.loading_total = len(tickets)
-                                self.loading_complete = True
-
-                            # Restart background transition loading
-                            thread = threading.Thread(target=self._load_transitions_background, args=(tickets,), daemon=True)
-                            thread.start()
-
                             self._show_message(stdscr, f"✓ Loaded {len(tickets)} tickets (Default)", height, width)
                         else:
                             self._show_message(stdscr, "No tickets found", height, width)
@@ -922,6 +1217,19 @@ class JiraTUI:
                         self._show_message(stdscr, f"✗ Error: {str(e)}", height, width)
             elif key == ord('?'):  # Help
                 show_help = True
+            elif key == curses.KEY_RESIZE:  # Terminal resized - drop width-keyed caches
+                _get_text_wrapper.cache_clear()
+                _wrap_cached.cache_clear()
+                self._legend_cache.clear()
+
+            # Anything but navigation may have drawn over stdscr (dialogs, editors)
+            if key not in navigation_keys:
+                chrome_dirty = True
+
+            # Navigation that didn't move anything (j at the bottom, k at the top,
+            # scrolling past the end) leaves the screen exactly as it was
+            if key in navigation_keys and (selected_idx, scroll_offset, self.detail_scroll_offset) == nav_state:
+                needs_redraw = detail_dirty = False
 
         return 0
 
@@ -989,15 +1297,81 @@ class JiraTUI:
                 'description', 'reporter', 'created', 'issuetype', 'labels',
                 'parent', 'issuelinks', 'comment', 'resolution'
             ]
-            issues = self.viewer.utils.fetch_all_jql_results(
-                query_or_ticket, fields, expand='changelog', progress_callback=progress_callback, stdscr=stdscr
-            )
+            issues = self._fetch_jql_with_disk_cache(query_or_ticket, fields, progress_callback, stdscr)
 
             # Apply consistent sorting
             issues = self._sort_tickets(issues, query_or_ticket)
 
             return issues, False
 
+    def _fetch_jql_with_disk_cache(self, jql: str, fields: List[str], progress_callback=None,
+                                   stdscr=None) -> List[dict]:
+        """
+        Fetch a JQL query's tickets, reusing unchanged ones from the SQLite cache.
+
+        The query itself only returns key + updated; tickets whose cached copy has
+        the same updated timestamp (and every requested field) come from disk, and
+        only new or changed tickets are fetched in full and written back.
+
+        Args:
+            jql: JQL query
+            fields: Fields the full tickets must include
+            progress_callback: Optional callback for progress of the key/updated query,
+                then of fetching the stale tickets
+            stdscr: Optional curses screen for count progress and interruption
+
+        Returns:
+            Full tickets in query result order
+        """
+        utils = self.viewer.utils
+        listing = utils.fetch_all_jql_results(
+            jql, ['updated'], progress_callback=progress_callback, stdscr=stdscr
+        )
+        ticket_keys = [issue['key'] for issue in listing if issue.get('key')]
+
+        cached = {}
+        try:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(ticket_keys), 500):
+                cached.update(utils.cache.get_many_tickets(ticket_keys[start:start + 500]))
+        except Exception:
+            cached = {}  # Unreadable cache - fetch everything
+
+        needed_fields = [field for field in fields if field != 'key']
+        stale_keys = []
+        for issue in listing:
+            cached_ticket = cached.get(issue.get('key'))
+            cached_fields = cached_ticket.get('fields', {}) if cached_ticket else {}
+            if (not cached_ticket or 'changelog' not in cached_ticket
+                    or cached_fields.get('updated') != issue.get('fields', {}).get('updated')
+                    or any(field not in cached_fields for field in needed_fields)):
+                stale_keys.append(issue.get('key'))
+
+        # Stale tickets go through the parallel key-page fetch; the progress bar
+        # restarts at 0/len(stale_keys) for this second phase
+        issues = utils.fetch_issues_by_keys(stale_keys, fields, expand='changelog',
+                                            progress_callback=progress_callback)
+        if issues is None:
+            # A key page failed (e.g. a ticket deleted since the listing): fetch the
+            # whole query in full rather than silently drop that page's tickets
+            tickets = utils.fetch_all_jql_results(jql, fields, expand='changelog',
+                                                  progress_callback=progress_callback, stdscr=stdscr)
+            try:
+                utils.cache.set_many_tickets(tickets)
+            except Exception:
+                pass
+            return tickets
+
+        fetched = {issue['key']: issue for issue in issues if issue.get('key')}
+        if fetched:
+            try:
+                utils.cache.set_many_tickets(list(fetched.values()))
+            except Exception:
+                pass  # Cache is an optimization; the fetched tickets are still returned
+
+        return [fetched.get(key) or cached[key] for key in ticket_keys
+                if key in fetched or key in cached]
+
     def _fetch_single_ticket(self, ticket_key: str) -> Optional[dict]:
         """
         Fetch a single ticket's full details.
@@ -1006,6 +1380,52 @@ class JiraTUI:
         """
         return self.viewer.fetch_ticket_details(ticket_key)
 
+    # Offsets from the selection to prefetch, most likely next ticket first
+    _PREFETCH_OFFSETS = (0, 1, -1, 2, -2)
+
+    def _prefetch_neighbors(self, tickets: List[dict], selected_idx: int) -> None:
+        """
+        Fetch uncached tickets around the selection in the background.
+
+        Runs on idle ticks once background loading is done, so tickets dropped
+        from the cache (or missed by the batch load) are ready before j/k lands
+        on them. A newer selection supersedes prefetches that haven't started.
+        """
+        if not self.loading_complete or self._shutdown_flag or self._prefetch_executor is None:
+            return
+
+        wanted = []
+        for offset in self._PREFETCH_OFFSETS:
+            idx = selected_idx + offset
+            if 0 <= idx < len(tickets):
+                ticket_key = tickets[idx].get('key')
+                if ticket_key and ticket_key not in self.ticket_cache:
+                    wanted.append(ticket_key)
+
+        # Finished futures stay while their ticket is still wanted, so a failed
+        # fetch isn't retried every tick - only after the selection moves away
+        for ticket_key, future in list(self._pending_prefetch.items()):
+            if ticket_key not in wanted and (future.done() or future.cancel()):
+                del self._pending_prefetch[ticket_key]
+
+        for ticket_key in wanted:
+            if ticket_key not in self._pending_prefetch:
+                self._pending_prefetch[ticket_key] = self._prefetch_executor.submit(
+                    self._prefetch_ticket, ticket_key)
+
+    def _prefetch_ticket(self, ticket_key: str) -> None:
+        """Prefetch worker: cache one ticket and signal the UI loop."""
+        if self._shutdown_flag or ticket_key in self.ticket_cache:
+            return
+        try:
+            full_ticket = self._fetch_single_ticket(ticket_key)
+        except Exception:
+            return  # Best effort; retried after the selection moves away and back
+        if full_ticket and not self._shutdown_flag:
+            with self.loading_lock:
+                self.ticket_cache.setdefault(ticket_key, full_ticket)
+            self._signal_loaded(ticket_key)
+
     def _fetch_transitions(self, ticket_key: str) -> List[dict]:
         """
         Fetch available transitions for a ticket.
@@ -1015,46 +1435,59 @@ class JiraTUI:
         transitions = self.ticket_controller.fetch_transitions(ticket_key)
         return transitions if transitions else []
 
-    def _load_tickets_background(self, tickets: List[dict]) -> None:
-        """Background thread to load ticket details with parallel fetching."""
-        max_workers = 5  # Fetch up to 5 tickets concurrently
+    def _apply_new_query(self, stdscr, new_query: str, loading_text: str = "Loading tickets...") -> List[dict]:
+        """
+        Fetch tickets for a new query and make them the cached working set.
 
-        # Use thread pool to fetch tickets in parallel
-        executor = ThreadPoolExecutor(max_workers=max_workers)
-        try:
-            # Submit all fetch tasks
-            future_to_key = {
-                executor.submit(self._fetch_single_ticket, ticket.get('key')): ticket.get('key')
-                for ticket in tickets if ticket.get('key')
-            }
+        Shared by the dashboard (d), new issue (n) and query (s/S) handlers. On a
+        non-empty result the caches are reset and transitions reload in the
+        background; the caller resets its selection/search state. Fetch errors
+        propagate so each handler can report them in its own words.
 
-            # Process results as they complete
-            for future in as_completed(future_to_key):
-                # Check if we should shutdown
-                if self._shutdown_flag:
-                    break
+        Args:
+            stdscr: Curses screen (for the loading notice and count progress)
+            new_query: Ticket key or JQL query to load
+            loading_text: Notice shown while fetching
 
-                ticket_key = future_to_key[future]
-                try:
-                    full_ticket = future.result()
-                    if full_ticket:
-                        with self.loading_lock:
-                            self.ticket_cache[ticket_key] = full_ticket
-                            self.loading_count += 1
-
-                        # Only fetch transitions if not shutting down
-                        if not self._shutdown_flag:
-                            executor.submit(self._cache_transitions, ticket_key)
-                except Exception:
-                    # Skip failed tickets
-                    pass
-        finally:
-            # Shutdown executor without waiting for pending tasks
-            executor.shutdown(wait=False)
+        Returns:
+            Fetched tickets (empty list if none matched)
+        """
+        self._set_status(stdscr, loading_text)
+
+        tickets, _ = self._fetch_tickets(new_query, stdscr=stdscr)
+        if tickets:
+            # Reset caches and stale tickets, caching all tickets immediately
+            self._reset_cache_with_tickets(tickets)
+
+            # Restart background transition loading
+            threading.Thread(target=self._load_transitions_background, args=(tickets,), daemon=True).start()
 
-        # Mark loading as complete
+        return tickets
+
+    def _reset_cache_with_tickets(self, tickets: List[dict], clear_transitions: bool = True) -> None:
+        """
+        Replace the ticket cache with a freshly fetched ticket list.
+
+        The JQL results already include every field the detail pane needs, so the
+        tickets are cached as-is and loading is marked complete. Clearing and
+        repopulating happen under one loading_lock acquisition so background
+        loaders never observe a half-built cache.
+
+        Args:
+            tickets: Tickets from the new query
+            clear_transitions: Also drop cached transitions (False keeps them until
+                the background transition reload replaces them)
+        """
+        new_cache = {ticket['key']: ticket for ticket in tickets if ticket.get('key')}
         with self.loading_lock:
+            self.ticket_cache.clear()
+            self.ticket_cache.update(new_cache)
+            if clear_transitions:
+                self.transitions_cache.clear()
+            self.loading_count = self.loading_total = len(tickets)
             self.loading_complete = True
+        self.stale_tickets.clear()
+        self._build_search_index(tickets)
 
     def _cache_transitions(self, ticket_key: str) -> None:
         """
@@ -1069,22 +1502,23 @@ class JiraTUI:
         self._fetch_transitions(ticket_key)
 
     def _load_transitions_background(self, tickets: List[dict]) -> None:
-        """Background thread to load transitions for all tickets."""
-        max_workers = 5  # Fetch up to 5 transitions concurrently
+        """Background thread to load transitions for all tickets with batched fetching (workers from _io_pool)."""
+        ticket_keys = [ticket.get('key') for ticket in tickets if ticket.get('key')]
 
-        executor = ThreadPoolExecutor(max_workers=max_workers)
-        try:
-            # Submit all transition fetch tasks
-            for ticket in tickets:
-                # Check if we should shutdown
-                if self._shutdown_flag:
-                    break
-                ticket_key = ticket.get('key')
-                if ticket_key:
-                    executor.submit(self._cache_transitions, ticket_key)
-        finally:
-            # Shutdown executor without waiting for pending tasks
-            executor.shutdown(wait=False)
+        # Fetch in batches first - a single search call expands transitions for up to 100 tickets
+        batch_results = self.ticket_controller.fetch_transitions_batch(ticket_keys)
+
+        # Fall back to per-ticket fetches only for keys missing from the batch response
+        missing_keys = [key for key in ticket_keys if key not in batch_results]
+        if not missing_keys:
+            return
+
+        # Submit remaining transition fetch tasks to the shared pool
+        for ticket_key in missing_keys:
+            # Check if we should shutdown
+            if self._shutdown_flag:
+                break
+            self._io_pool.submit(self._cache_transitions, ticket_key)
 
     def _cache_users_background(self, tickets: List[dict]) -> None:
         """
@@ -1383,6 +1817,47 @@ class JiraTUI:
 
         return (True, resolved)
 
+    def _read_choice_input(self, overlay, y: int, x: int, items: List[dict]) -> Optional[str]:
+        """
+        Read a numbered choice typed into a selection overlay.
+
+        Digits and Backspace edit the input, a letter (on empty input) selects the
+        first item whose name starts with it, and Enter accepts. The input is
+        echoed at (y, x) by hand; other keys (function keys, KEY_RESIZE,
+        non-ASCII) are ignored.
+
+        Returns:
+            The typed choice (possibly empty), or None if cancelled with q/ESC
+        """
+        input_str = ""
+        while True:
+            ch = overlay.getch()
+            if ch == ord('q') or ch == 27:  # q or ESC
+                return None
+            elif ch == ord('\n'):
+                return input_str
+            elif ch in (curses.KEY_BACKSPACE, 127, 8):
+                input_str = input_str[:-1]
+            elif ord('0') <= ch <= ord('9'):
+                input_str += chr(ch)
+            elif 0 <= ch < 128 and chr(ch).isalpha() and not input_str:
+                # First letter shortcut - find matching item
+                letter = chr(ch).lower()
+                for idx, item in enumerate(items):
+                    name = item.get('name', '')
+                    if name and name[0].lower() == letter:
+                        input_str = str(idx + 1)
+                        break
+            else:
+                continue
+
+            try:
+                # Trailing space erases the character removed by Backspace
+                overlay.addnstr(y, x, input_str + ' ', max(0, overlay.getmaxyx()[1] - x - 1))
+            except curses.error:
+                pass
+            overlay.refresh()
+
     def _handle_transition(self, stdscr, ticket_key: str, height: int, width: int):
         """Handle ticket transition (T key)."""
         # Get transitions with field info from API
@@ -1432,33 +1907,14 @@ class JiraTUI:
             if len(transitions) > max_visible:
                 overlay.addstr(max_visible + 2, 2, f"... and {len(transitions) - max_visible} more")
 
-            overlay.addstr(overlay_height - 2, 2, "Enter number, first letter, or q to cancel: ")
+            prompt = "Enter number, first letter, or q to cancel: "
+            overlay.addstr(overlay_height - 2, 2, prompt)
             overlay.refresh()
 
             # Get user input
-            curses.echo()
-            input_str = ""
-            while True:
-                ch = overlay.getch()
-                if ch == ord('q') or ch == 27:  # q or ESC
-                    curses.noecho()
-                    return
-                elif ch == ord('\n'):
-                    break
-                elif ch in [curses.KEY_BACKSPACE, 127, 8]:
-                    input_str = input_str[:-1]
-                elif chr(ch).isdigit():
-                    input_str += chr(ch)
-                elif chr(ch).isalpha() and not input_str:
-                    # First letter shortcut - find matching transition
-                    letter = chr(ch).lower()
-                    for idx, transition in enumerate(transitions):
-                        name = transition.get('name', '')
-                        if name and name[0].lower() == letter:
-                            input_str = str(idx + 1)
-                            break
-
-            curses.noecho()
+            input_str = self._read_choice_input(overlay, overlay_height - 2, 2 + len(prompt), transitions)
+            if input_str is None:
+                return
 
             # Perform transition
             try:
@@ -1490,7 +1946,7 @@ class JiraTUI:
                     if 'customfield_11684' in fields and fields['customfield_11684'].get('required'):
                         # Get current user's account ID
                         try:
-                            me_response = self.viewer.utils.call_jira_api("/myself")
+                            me_response = self.viewer.utils.call_jira_api("/myself", cache_ttl=300)
                             if me_response and 'accountId' in me_response:
                                 transition_fields['customfield_11684'] = {'accountId': me_response['accountId']}
                         except:
@@ -1587,33 +2043,14 @@ class JiraTUI:
             if len(resolutions) > max_visible:
                 overlay.addstr(max_visible + 2, 2, f"... and {len(resolutions) - max_visible} more")
 
-            overlay.addstr(overlay_height - 2, 2, "Enter number, first letter, or q to cancel: ")
+            prompt = "Enter number, first letter, or q to cancel: "
+            overlay.addstr(overlay_height - 2, 2, prompt)
             overlay.refresh()
 
             # Get user input
-            curses.echo()
-            input_str = ""
-            while True:
-                ch = overlay.getch()
-                if ch == ord('q') or ch == 27:  # q or ESC
-                    curses.noecho()
-                    return None
-                elif ch == ord('\n'):
-                    break
-                elif ch in [curses.KEY_BACKSPACE, 127, 8]:
-                    input_str = input_str[:-1]
-                elif chr(ch).isdigit():
-                    input_str += chr(ch)
-                elif chr(ch).isalpha() and not input_str:
-                    # First letter shortcut - find matching resolution
-                    letter = chr(ch).lower()
-                    for idx, resolution in enumerate(resolutions):
-                        name = resolution.get('name', '')
-                        if name and name[0].lower() == letter:
-                            input_str = str(idx + 1)
-                            break
-
-            curses.noecho()
+            input_str = self._read_choice_input(overlay, overlay_height - 2, 2 + len(prompt), resolutions)
+            if input_str is None:
+                return None
 
             # Return selected resolution ID
             try:
@@ -1650,11 +2087,24 @@ class JiraTUI:
         except curses.error:
             return False
 
+    def _scratch_path(self) -> str:
+        """
+        Path of the session's editor scratch file.
+
+        Every $EDITOR flow (comments, edits, queries, link comments) runs one at
+        a time, so they share a single file that each rewrites, instead of
+        creating and unlinking a temp file per use. The private directory lives
+        on the /dev/shm ramdisk where there is one (Linux), otherwise in the
+        system temp dir, and is removed at exit.
+        """
+        if self._scratch_dir is None:
+            parent = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+            self._scratch_dir = tempfile.mkdtemp(prefix='jira_tui_', dir=parent)
+            atexit.register(shutil.rmtree, self._scratch_dir, ignore_errors=True)
+        return os.path.join(self._scratch_dir, 'edit.txt')
+
     def _prompt_for_comment_vim(self, stdscr, ticket_key: str, height: int, width: int) -> Optional[str]:
         """Prompt for comment using vim editor. Returns comment text or None if cancelled."""
-        import tempfile
-        import os
-
         # Get ticket details for context
         with self.loading_lock:
             ticket = self.ticket_cache.get(ticket_key)
@@ -1666,8 +2116,8 @@ class JiraTUI:
             return None
 
         # Create temp file with ticket info as comments
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            temp_path = f.name
+        temp_path = self._scratch_path()
+        with open(temp_path, 'w') as f:
             fields = ticket.get('fields', {})
 
             f.write(f"# Ticket: {ticket_key}\n")
@@ -1681,12 +2131,12 @@ class JiraTUI:
             f.write(f"#\n")
             f.write("\n")
 
-        # Open vim editor
+        # Open $EDITOR (probed once at startup)
         curses.def_prog_mode()
         curses.endwin()
 
         try:
-            subprocess.call(['vim', temp_path])
+            subprocess.call(self._editor + [temp_path])
         finally:
             curses.reset_prog_mode()
             stdscr.refresh()
@@ -1700,9 +2150,6 @@ class JiraTUI:
             comment_lines = [line.rstrip() for line in lines if not line.strip().startswith('#')]
             comment_text = '\n'.join(comment_lines).strip()
 
-            # Clean up temp file
-            os.unlink(temp_path)
-
             return comment_text if comment_text else None
 
         except Exception:
@@ -1838,9 +2285,6 @@ class JiraTUI:
 
     def _handle_comment(self, stdscr, ticket_key: str, height: int, width: int):
         """Handle adding a comment (C key)."""
-        import tempfile
-        import subprocess
-
         # Get ticket details for context
         with self.loading_lock:
             ticket = self.ticket_cache.get(ticket_key)
@@ -1853,8 +2297,8 @@ class JiraTUI:
             return
 
         # Create temp file with ticket info as comments
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            temp_path = f.name
+        temp_path = self._scratch_path()
+        with open(temp_path, 'w') as f:
             fields = ticket.get('fields', {})
 
             f.write(f"# Ticket: {ticket_key}\n")
@@ -1868,12 +2312,12 @@ class JiraTUI:
             f.write(f"#\n")
             f.write("\n")
 
-        # Open vim editor
+        # Open $EDITOR (probed once at startup)
         curses.def_prog_mode()
         curses.endwin()
 
         try:
-            subprocess.call(['vim', temp_path])
+            subprocess.call(self._editor + [temp_path])
         finally:
             curses.reset_prog_mode()
             stdscr.refresh()
@@ -1887,10 +2331,6 @@ class JiraTUI:
             comment_lines = [line.rstrip() for line in lines if not line.strip().startswith('#')]
             comment_text = '\n'.join(comment_lines).strip()
 
-            # Clean up temp file
-            import os
-            os.unlink(temp_path)
-
             if not comment_text:
                 self._show_message(stdscr, "Comment cancelled (empty)", height, width)
                 return
@@ -1913,10 +2353,6 @@ class JiraTUI:
 
     def _handle_new_issue(self, stdscr, current_query: str, height: int, width: int) -> Optional[str]:
         """Handle creating a new issue (n key). Returns new ticket key or None."""
-        import tempfile
-        import subprocess
-        import os
-
         # Extract project from current query or default to CIPLAT
         project = self._extract_project_from_query(current_query) or "CIPLAT"
 
@@ -1927,16 +2363,16 @@ class JiraTUI:
             template = self._create_issue_template(project, error_message, previous_fields)
 
             # Write to temp file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                temp_path = f.name
+            temp_path = self._scratch_path()
+            with open(temp_path, 'w') as f:
                 f.write(template)
 
-            # Open vim editor
+            # Open $EDITOR (probed once at startup)
             curses.def_prog_mode()
             curses.endwin()
 
             try:
-                subprocess.call(['vim', temp_path])
+                subprocess.call(self._editor + [temp_path])
             finally:
                 curses.reset_prog_mode()
                 stdscr.refresh()
@@ -1946,8 +2382,6 @@ class JiraTUI:
                 with open(temp_path, 'r') as f:
                     template_text = f.read()
 
-                os.unlink(temp_path)
-
                 # Parse fields
                 fields = self._parse_issue_template(template_text)
                 if not fields:
@@ -1985,10 +2419,6 @@ class JiraTUI:
 
     def _handle_edit_issue(self, stdscr, ticket_key: str, height: int, width: int):
         """Handle editing an issue (e key)."""
-        import tempfile
-        import subprocess
-        import os
-
         # Fetch full ticket details
         with self.loading_lock:
             ticket = self.ticket_cache.get(ticket_key)
@@ -2006,16 +2436,16 @@ class JiraTUI:
             template = self._create_edit_template(ticket, error_message)
 
             # Write to temp file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                temp_path = f.name
+            temp_path = self._scratch_path()
+            with open(temp_path, 'w') as f:
                 f.write(template)
 
-            # Open vim editor
+            # Open $EDITOR (probed once at startup)
             curses.def_prog_mode()
             curses.endwin()
 
             try:
-                subprocess.call(['vim', temp_path])
+                subprocess.call(self._editor + [temp_path])
             finally:
                 curses.reset_prog_mode()
                 stdscr.refresh()
@@ -2025,8 +2455,6 @@ class JiraTUI:
                 with open(temp_path, 'r') as f:
                     template_text = f.read()
 
-                os.unlink(temp_path)
-
                 # Parse fields
                 parsed = self._parse_issue_template(template_text)
                 if not parsed:
@@ -2078,10 +2506,6 @@ class JiraTUI:
 
     def _handle_weight_edit(self, stdscr, ticket_key: str, height: int, width: int):
         """Handle quick weight/story points edit (w key)."""
-        import tempfile
-        import subprocess
-        import os
-
         # Get current ticket
         with self.loading_lock:
             ticket = self.ticket_cache.get(ticket_key)
@@ -2119,16 +2543,16 @@ class JiraTUI:
             ])
 
             # Write to temp file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                temp_path = f.name
+            temp_path = self._scratch_path()
+            with open(temp_path, 'w') as f:
                 f.write('\n'.join(template))
 
-            # Open vim
+            # Open $EDITOR (probed once at startup)
             curses.def_prog_mode()
             curses.endwin()
 
             try:
-                subprocess.call(['vim', temp_path])
+                subprocess.call(self._editor + [temp_path])
             finally:
                 curses.reset_prog_mode()
                 stdscr.refresh()
@@ -2138,8 +2562,6 @@ class JiraTUI:
                 with open(temp_path, 'r') as f:
                     text = f.read()
 
-                os.unlink(temp_path)
-
                 parsed = self._parse_weight_template(text)
                 if parsed is None:
                     self._show_message(stdscr, "Weight edit cancelled", height, width)
@@ -2219,13 +2641,26 @@ class JiraTUI:
         return result
 
     def _handle_query_change(self, stdscr, current_query: str, is_edit_mode: bool, height: int, width: int) -> Optional[str]:
-        """Handle changing the query (s/S key). Returns new query or None if cancelled."""
-        import tempfile
-        import subprocess
+        """
+        Handle changing the query (s/S key). Returns new query or None if cancelled.
+
+        Single-line queries are edited in place on the status line; Ctrl+X there
+        (or a multi-line query) opens $EDITOR instead.
+        """
+        initial = current_query if is_edit_mode and current_query else ""
+        if '\n' not in initial:
+            new_query, use_editor = self._inline_edit(stdscr, height - 1, width, "Query: ", initial)
+            if not use_editor:
+                new_query = (new_query or "").strip()
+                if not new_query:
+                    self._show_message(stdscr, "Query change cancelled (empty)", height, width)
+                    return None
+                return new_query
+            initial = new_query
 
         # Create temp file with helpful comments
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            temp_path = f.name
+        temp_path = self._scratch_path()
+        with open(temp_path, 'w') as f:
 
             # Write helpful comments
             f.write("# Enter a JQL query or ticket key below\n")
@@ -2237,18 +2672,18 @@ class JiraTUI:
             f.write("# Lines starting with # will be ignored\n")
             f.write("#\n")
 
-            # If edit mode, include current query
-            if is_edit_mode and current_query:
-                f.write(f"{current_query}\n")
+            # Include the query being edited (or typed so far inline)
+            if initial:
+                f.write(f"{initial}\n")
             else:
                 f.write("\n")
 
-        # Open vim editor
+        # Open $EDITOR (probed once at startup)
         curses.def_prog_mode()
         curses.endwin()
 
         try:
-            subprocess.call(['vim', temp_path])
+            subprocess.call(self._editor + [temp_path])
         finally:
             curses.reset_prog_mode()
             stdscr.refresh()
@@ -2262,10 +2697,6 @@ class JiraTUI:
             query_lines = [line.rstrip() for line in lines if not line.strip().startswith('#')]
             new_query = '\n'.join(query_lines).strip()
 
-            # Clean up temp file
-            import os
-            os.unlink(temp_path)
-
             if not new_query:
                 self._show_message(stdscr, "Query change cancelled (empty)", height, width)
                 return None
@@ -2277,17 +2708,22 @@ class JiraTUI:
             return None
 
     def _search_user_by_display_name(self, display_name: str) -> Optional[str]:
-        """Search for user by display name and return accountId."""
-        import urllib.parse
+        """
+        Search for user by display name and return accountId.
+
+        Searches are memoized for 5 minutes (call_jira_api cache_ttl), so a name
+        mentioned several times (or again in the next comment) costs one API
+        call; r (and R's users refresh) clears the memo.
+        """
         try:
             # Remove @ prefix if present
             name = display_name.lstrip('@').strip()
 
             # URL encode the name for the query
-            encoded_name = urllib.parse.quote(name)
+            encoded_name = quote(name)
 
             # Search for users matching the display name
-            result = self.viewer.utils.call_jira_api(f'/user/search?query={encoded_name}')
+            result = self.viewer.utils.call_jira_api(f'/user/search?query={encoded_name}', cache_ttl=300)
 
             if result and len(result) > 0:
                 # Return first match's accountId
@@ -2304,22 +2740,14 @@ class JiraTUI:
         - Markdown links [text](url)
         - Bare URLs
         """
-        import re
+        # Plain prose (most lines) can't match any of the patterns
+        if '@' not in text and '[' not in text and 'http' not in text:
+            return [{"type": "text", "text": text}]
 
         result = []
         pos = 0
 
-        # Pattern for markdown links [text](url)
-        markdown_link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        # Pattern for @mentions (word characters, spaces, dots, hyphens)
-        mention_pattern = r'@([\w\s\.\-]+?)(?=\s|$|[,\.](?:\s|$))'
-        # Pattern for bare URLs
-        url_pattern = r'https?://[^\s\)]+'
-
-        # Combine patterns - order matters! Markdown links first, then mentions, then bare URLs
-        combined = f'({markdown_link_pattern})|({mention_pattern})|({url_pattern})'
-
-        for match in re.finditer(combined, text):
+        for match in _INLINE_MARKUP_RE.finditer(text):
             # Add text before match
             if match.start() > pos:
                 result.append({
@@ -2384,6 +2812,7 @@ class JiraTUI:
         """
         lines = text.split('\n')
         content = []
+        empty_paragraph = {"type": "paragraph", "content": []}  # Shared by every blank line
         i = 0
 
         while i < len(lines):
@@ -2425,10 +2854,7 @@ class JiraTUI:
                 })
                 i += 1
             else:  # Empty line - add empty paragraph for spacing
-                content.append({
-                    "type": "paragraph",
-                    "content": []
-                })
+                content.append(empty_paragraph)
                 i += 1
 
         # Handle case where text is empty or only whitespace
@@ -2446,20 +2872,18 @@ class JiraTUI:
 
     def _extract_project_from_query(self, query: str) -> Optional[str]:
         """Extract project key from JQL query or ticket key."""
-        import re
-
         # Check if it's a ticket key (e.g., "CIPLAT-1234")
-        ticket_match = re.match(r'^([A-Z]+)-\d+', query)
+        ticket_match = _TICKET_PROJECT_RE.match(query)
         if ticket_match:
             return ticket_match.group(1)
 
         # Check for "project = KEY" or "project=KEY"
-        project_match = re.search(r'project\s*=\s*["\']?([A-Z]+)["\']?', query, re.IGNORECASE)
+        project_match = _PROJECT_EQ_RE.search(query)
         if project_match:
             return project_match.group(1)
 
         # Check for "project IN (KEY1, KEY2)"
-        project_in_match = re.search(r'project\s+IN\s*\(\s*([A-Z, ]+)\)', query, re.IGNORECASE)
+        project_in_match = _PROJECT_IN_RE.search(query)
         if project_in_match:
             projects = [p.strip().strip('"\'') for p in project_in_match.group(1).split(',')]
             if projects:
@@ -3429,6 +3853,7 @@ class JiraTUI:
                         self.cache_controller.refresh_metadata('issue_types')
                         # Force fetch to rebuild cache
                         self.viewer.utils.get_link_types(force_refresh=True)
+                        self.viewer.utils.clear_cache()
                         self.viewer.utils.get_users(force_refresh=True)
                         self._show_message(stdscr, "✓ Refreshed all cache", height, width)
                     elif category == 'link_types':
@@ -3437,6 +3862,7 @@ class JiraTUI:
                         self._show_message(stdscr, "✓ Refreshed link types cache", height, width)
                     elif category == 'users':
                         self.cache_controller.refresh_metadata('users')
+                        self.viewer.utils.clear_cache()
                         self.viewer.utils.get_users(force_refresh=True)
                         self._show_message(stdscr, "✓ Refreshed users cache", height, width)
 
@@ -3447,16 +3873,56 @@ class JiraTUI:
 
     def _get_status_color(self, status_letter: str) -> int:
         """Get curses color pair for a status letter."""
-        if status_letter in ['C', 'V', 'Z', 'Y', 'M']:
-            return curses.color_pair(1)  # Green for done
-        elif status_letter in ['A', 'B', 'S', 'W']:
-            return curses.color_pair(3)  # Blue for backlog
-        elif status_letter in ['P', 'R', 'Q', 'T']:
-            return curses.color_pair(2)  # Yellow for active
-        elif status_letter in ['D', 'X', '_']:
-            return curses.color_pair(4)  # Red for blocked
+        pair = self._STATUS_COLOR_PAIRS.get(status_letter)
+        return curses.color_pair(pair) if pair else curses.A_NORMAL
+
+    def _get_tag_attr(self, tag: str) -> int:
+        """
+        Get the curses attribute for a detail-line tag, memoized in _tag_attrs.
+
+        Tags come from a small fixed vocabulary (KEY, STATUS_<letter>,
+        PRIORITY_<name>, DATE_<n>, ...), so the dispatch below runs once per
+        distinct tag rather than for every visible line on every frame.
+        """
+        if tag == "KEY":
+            attr = curses.color_pair(1) | curses.A_BOLD  # Green bold
+        elif tag == "SUMMARY":
+            attr = curses.A_BOLD  # Bold
+        elif tag == "HEADER":
+            attr = curses.color_pair(3)  # Blue
+        elif tag.startswith("STATUS_"):
+            # Map status letter to color (matching dashboard style)
+            status_letter = tag.split("_")[1]
+            attr = self._get_status_color(status_letter)
+        elif tag.startswith("PRIORITY_"):
+            # Map priority to color
+            priority = tag.split("_", 1)[1]
+            if priority in ['Critical', 'Blocker', 'Highest']:
+                attr = curses.color_pair(4)  # Red
+            elif priority in ['High']:
+                attr = curses.color_pair(2)  # Yellow
+            elif priority in ['Low', 'Lowest']:
+                attr = curses.color_pair(3)  # Blue
+            else:
+                attr = curses.A_NORMAL  # Medium/None
+        elif tag.startswith("DATE_"):
+            # Map relative date to color
+            color_num = tag.split("_")[1]
+            if color_num == '1':
+                attr = curses.color_pair(1)  # Green (< 2 days)
+            elif color_num == '2':
+                attr = curses.color_pair(2)  # Yellow (2-4 days)
+            else:
+                attr = curses.A_NORMAL  # Normal (> 4 days)
+        elif tag == "WARN":
+            attr = curses.color_pair(4)  # Red for warnings/flags
+        elif tag == "CODE":
+            attr = curses.A_DIM  # Dim/grey for code blocks
         else:
-            return curses.A_NORMAL
+            attr = curses.A_NORMAL
+
+        self._tag_attrs[tag] = attr
+        return attr
 
     def _handle_issue_links(self, stdscr, ticket_key: str, tickets: list, height: int, width: int):
         """Handle managing issue links (L key)."""
@@ -3894,8 +4360,8 @@ class JiraTUI:
                     y_pos = idx - start_idx + 2
                     x_pos = 2
                     try:
-                        overlay.addstr(y_pos, x_pos, f"[{status_letter}] ", status_color | attr)
-                        x_pos += len(f"[{status_letter}] ")
+                        overlay.addstr(y_pos, x_pos, _STATUS_TAGS[status_letter] + " ", status_color | attr)
+                        x_pos += 4  # "[L] "
                         remaining = f"{key}: {summary}"
                         overlay.addstr(y_pos, x_pos, remaining[:menu_width - x_pos - 2], attr)
                     except curses.error:
@@ -3941,10 +4407,6 @@ class JiraTUI:
             - Empty string if user saved with only comments (no comment, but proceed)
             - Comment text if user added uncommented content
         """
-        import tempfile
-        import subprocess
-        import os
-
         # Create temp file with link details as template
         template_lines = [
             f"# Creating Issue Link",
@@ -3961,16 +4423,16 @@ class JiraTUI:
         ]
         template_content = '\n'.join(template_lines)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            temp_path = f.name
+        temp_path = self._scratch_path()
+        with open(temp_path, 'w') as f:
             f.write(template_content)
 
-        # Open vim editor
+        # Open $EDITOR (probed once at startup)
         curses.def_prog_mode()
         curses.endwin()
 
         try:
-            subprocess.call(['vim', temp_path])
+            subprocess.call(self._editor + [temp_path])
         finally:
             curses.reset_prog_mode()
             stdscr.refresh()
@@ -3984,8 +4446,6 @@ class JiraTUI:
             with open(temp_path, 'r') as f:
                 content = f.read()
 
-            os.unlink(temp_path)
-
             # Check if file is completely empty (user deleted everything = abort)
             if not content.strip():
                 return None
@@ -4060,8 +4520,8 @@ class JiraTUI:
                     y_pos = idx - start_idx + 2
                     x_pos = 2
                     try:
-                        overlay.addstr(y_pos, x_pos, f"[{status_letter}] ", status_color | attr)
-                        x_pos += len(f"[{status_letter}] ")
+                        overlay.addstr(y_pos, x_pos, _STATUS_TAGS[status_letter] + " ", status_color | attr)
+                        x_pos += 4  # "[L] "
                         remaining = f"{key}: {summary}"
                         overlay.addstr(y_pos, x_pos, remaining[:menu_width - x_pos - 2], attr)
                     except curses.error:
@@ -4213,10 +4673,6 @@ class JiraTUI:
             - Empty string if user saved with only comments (no comment, but proceed)
             - Comment text if user added uncommented content
         """
-        import tempfile
-        import subprocess
-        import os
-
         # Create temp file with link details as template
         template_lines = [
             f"# Removing Issue Link",
@@ -4234,16 +4690,16 @@ class JiraTUI:
         ]
         template_content = '\n'.join(template_lines)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            temp_path = f.name
+        temp_path = self._scratch_path()
+        with open(temp_path, 'w') as f:
             f.write(template_content)
 
-        # Open vim editor
+        # Open $EDITOR (probed once at startup)
         curses.def_prog_mode()
         curses.endwin()
 
         try:
-            subprocess.call(['vim', temp_path])
+            subprocess.call(self._editor + [temp_path])
         finally:
             curses.reset_prog_mode()
             stdscr.refresh()
@@ -4257,8 +4713,6 @@ class JiraTUI:
             with open(temp_path, 'r') as f:
                 content = f.read()
 
-            os.unlink(temp_path)
-
             # Check if file is completely empty (user deleted everything = abort)
             if not content.strip():
                 return None
@@ -4428,8 +4882,13 @@ class JiraTUI:
             ('X', 'Blocked', 4),
         ]
 
-    def _draw_legend(self, stdscr, start_y: int, max_width: int) -> int:
-        """Draw status legend at the top of the left pane. Returns number of lines used."""
+    def _pack_legend(self, max_width: int) -> list:
+        """
+        Lay the legend out for max_width.
+
+        Returns one list per line of (x, text, attr) segments, positioned and
+        formatted so _draw_legend only has to addstr them.
+        """
         legend_items = self._get_legend_items()
 
         # Build legend with proper spacing
@@ -4456,25 +4915,35 @@ class JiraTUI:
         if current_line:
             lines.append(current_line)
 
-        # Draw the lines
-        for line_idx, line_items in enumerate(lines):
-            y = start_y + line_idx
+        packed = []
+        for line_items in lines:
+            segments = []
             x = 0
-
             for idx, (letter, name, color_pair) in enumerate(line_items):
+                # [L] in color, then the name
+                tag = _STATUS_TAGS[letter]
+                segments.append((x, tag, curses.color_pair(color_pair)))
+                x += len(tag)
+
+                # Add spacing between items (but not after the last one)
+                label = f" {name}" if idx == len(line_items) - 1 else f" {name}  "
+                segments.append((x, label, curses.A_NORMAL))
+                x += len(label)
+            packed.append(segments)
+        return packed
+
+    def _draw_legend(self, stdscr, start_y: int, max_width: int) -> int:
+        """Draw status legend at the top of the left pane. Returns number of lines used."""
+        lines = self._legend_cache.get(max_width)
+        if lines is None:
+            lines = self._legend_cache[max_width] = self._pack_legend(max_width)
+
+        # Draw the lines
+        for line_idx, segments in enumerate(lines):
+            y = start_y + line_idx
+            for x, text, attr in segments:
                 try:
-                    # Draw [L] in color
-                    stdscr.addstr(y, x, f"[{letter}]", curses.color_pair(color_pair))
-                    x += len(f"[{letter}]")
-
-                    # Draw name
-                    stdscr.addstr(y, x, f" {name}", curses.A_NORMAL)
-                    x += len(f" {name}")
-
-                    # Add spacing between items (but not after the last one)
-                    if idx < len(line_items) - 1:
-                        stdscr.addstr(y, x, "  ", curses.A_NORMAL)
-                        x += 2
+                    stdscr.addstr(y, x, text, attr)
                 except curses.error:
                     pass
 
@@ -4579,31 +5048,10 @@ class JiraTUI:
         for i in range(scroll_offset, min(scroll_offset + visible_height, len(tickets))):
             y = i - scroll_offset + ticket_start_y
 
-            issue = tickets[i]
-            fields = issue.get('fields', {})
-            key = issue.get('key', 'N/A')
-            status = fields.get('status', {}).get('name', 'Unknown')
-            status_letter = self.viewer.utils.get_status_letter(status)
-
-            # Extract flags if present (handle None value)
-            flags = fields.get('customfield_10023') or []
-            flag_text = ''
-            if flags:
-                flag_values = []
-                for flag in flags:
-                    if isinstance(flag, dict):
-                        flag_values.append(flag.get('value', str(flag)))
-                    else:
-                        flag_values.append(str(flag))
-                if flag_values:
-                    flag_text = f"[{', '.join(flag_values)}] "
-
-            # Calculate available space for summary (key + status + separators + flags = variable)
-            summary_max = max_width - len(key) - len(flag_text) - 6
-            summary = fields.get('summary', 'No summary')[:summary_max]
+            text, color_spans, summary_x, text_width = self._get_list_row(tickets[i], max_width, stdscr.encoding)
 
             # Check if ticket is stale (may no longer match query)
-            is_stale = key in self.stale_tickets
+            is_stale = tickets[i].get('key', 'N/A') in self.stale_tickets
 
             # Highlight selection
             is_selected = i == selected_idx
@@ -4613,53 +5061,86 @@ class JiraTUI:
             if is_stale:
                 base_attr |= curses.A_DIM
 
-            # Determine status color (matching dashboard style)
-            status_color = self._get_status_color(status_letter)
-
-            # Draw line in colored segments
+            # Draw the whole line, then color the status, key and flags in place
             try:
-                x_pos = 0
-                # Draw status indicator with color
-                stdscr.addstr(y, x_pos, f"[{status_letter}]", status_color | base_attr)
-                x_pos += len(f"[{status_letter}]")
-
-                # Draw space
-                stdscr.addstr(y, x_pos, " ", base_attr)
-                x_pos += 1
-
-                # Draw key in green (or dim if stale)
-                stdscr.addstr(y, x_pos, key, curses.color_pair(1) | base_attr)
-                x_pos += len(key)
-
-                # Draw colon
-                stdscr.addstr(y, x_pos, ": ", base_attr)
-                x_pos += 2
-
-                # Draw flags in red if present
-                if flag_text:
-                    stdscr.addstr(y, x_pos, flag_text, curses.color_pair(4) | base_attr)
-                    x_pos += len(flag_text)
-
-                # Draw summary
-                stdscr.addstr(y, x_pos, summary, base_attr)
+                stdscr.addstr(y, 0, text, base_attr)
+                for x_pos, num, color_attr in color_spans:
+                    stdscr.chgat(y, x_pos, num, color_attr | base_attr)
 
                 # Add stale indicator at the end if stale
                 if is_stale:
                     stale_indicator = " [?]"
-                    if x_pos + len(stale_indicator) < max_width:
-                        stdscr.addstr(y, x_pos + len(summary), stale_indicator, base_attr)
+                    if summary_x + len(stale_indicator) < max_width:
+                        stdscr.addstr(y, text_width, stale_indicator, base_attr)
             except curses.error:
                 pass
 
+    def _get_list_row(self, issue: dict, max_width: int, encoding: str) -> tuple:
+        """
+        Get the pre-rendered text of a ticket's list row.
+
+        Returns (text, color_spans, summary_x, text_width): the whole row already
+        encoded for the window, so curses doesn't re-encode every row on every
+        frame, and the (x, cells, color_attr) spans to color in place with chgat
+        (status, key, flags). They only depend on the ticket and the pane width,
+        so they are cached on the ticket dict (refreshed tickets are new dicts)
+        and the per-frame work is one addstr plus a chgat per colored span.
+        """
+        row = issue.get('_list_row')
+        if row is not None and row[0] == (max_width, encoding):
+            return row[1]
+
+        fields = issue.get('fields', {})
+        key = issue.get('key', 'N/A')
+        status = fields.get('status', {}).get('name', 'Unknown')
+        status_letter = self.viewer.utils.get_status_letter(status)
+
+        # Extract flags if present (handle None value)
+        flags = fields.get('customfield_10023') or []
+        flag_text = ''
+        if flags:
+            flag_values = []
+            for flag in flags:
+                if isinstance(flag, dict):
+                    flag_values.append(flag.get('value', str(flag)))
+                else:
+                    flag_values.append(str(flag))
+            if flag_values:
+                flag_text = f"[{', '.join(flag_values)}] "
+
+        # Calculate available space for summary (key + status + separators + flags = variable)
+        summary_max = max_width - len(key) - len(flag_text) - 6
+        summary = fields.get('summary', 'No summary')[:summary_max]
+
+        # Determine status color (matching dashboard style)
+        status_color = self._get_status_color(status_letter)
+
+        # Status in its color, key in green, flags in red, the rest plain
+        parts = [(_STATUS_TAGS[status_letter], status_color), (" ", 0), (key, curses.color_pair(1)), (": ", 0)]
+        if flag_text:
+            parts.append((flag_text, curses.color_pair(4)))
+        parts.append((summary, 0))
+
+        color_spans = []
+        x_pos = 0
+        for text, color_attr in parts:
+            if color_attr:
+                color_spans.append((x_pos, len(text), color_attr))
+            x_pos += len(text)
+        text = "".join(text for text, _ in parts).encode(encoding, 'replace')
+
+        row = ((max_width, encoding), (text, tuple(color_spans), x_pos - len(summary), x_pos))
+        issue['_list_row'] = row
+        return row[1]
+
     def _draw_ticket_details(self, stdscr, ticket_key: str, x_offset: int,
                             max_height: int, max_width: int):
         """Draw ticket details in the right pane."""
         # Get full ticket details from cache
         ticket = self.ticket_cache.get(ticket_key)
         if not ticket:
-            # Check if still loading or actually failed
-            with self.loading_lock:
-                still_loading = not self.loading_complete
+            # Check if still loading or actually failed (atomic flag, no lock needed)
+            still_loading = not self.loading_complete
 
             try:
                 if still_loading:
@@ -4672,8 +5153,99 @@ class JiraTUI:
                 pass
             return
 
+        # Lay out a page past the visible rows, so half-page scrolling has room to move
+        lines, complete = self._get_detail_lines(ticket_key, ticket, max_width,
+                                                 self.detail_scroll_offset + 2 * max_height)
+
+        # Store total lines for scroll tracking (so far, while the layout is incomplete)
+        self.detail_total_lines = len(lines)
+
+        # Draw visible lines with scrolling support
+        visible_lines = lines[self.detail_scroll_offset:self.detail_scroll_offset + max_height - 1]
+
+        # Loop invariants hoisted out of the per-row work
+        tag_attrs = self._tag_attrs
+        addstr = stdscr.addstr
+        text_x = x_offset + 1
+        text_width = max_width - 2
+        link_attr = curses.color_pair(5)  # Cyan for links/mentions
+        for i, (tag, line) in enumerate(visible_lines):
+            # Handle segmented lines (inline styling)
+            if tag == "SEGMENTS":
+                # line is actually a list of (tag, text) segments
+                segments = line
+                x_pos = 0
+                for seg_tag, seg_text in segments:
+                    seg_attr = link_attr if seg_tag == "LINK" else curses.A_NORMAL
+
+                    try:
+                        # Only render what fits
+                        available = text_width - x_pos
+                        if available > 0:
+                            text_to_render = seg_text[:available]
+                            addstr(i, text_x + x_pos, text_to_render, seg_attr)
+                            x_pos += len(text_to_render)
+                    except curses.error:
+                        pass
+                continue
+
+            # Color for the tag (memoized per distinct tag)
+            attr = tag_attrs.get(tag)
+            if attr is None:
+                attr = self._get_tag_attr(tag)
+
+            try:
+                addstr(i, text_x, line[:text_width], attr)
+            except curses.error:
+                pass
+
+        # Show scroll indicator if content is scrolled
+        if self.detail_scroll_offset > 0 or self.detail_scroll_offset + max_height - 1 < self.detail_total_lines:
+            scroll_indicator = f"[{self.detail_scroll_offset + 1}-{min(self.detail_scroll_offset + max_height - 1, self.detail_total_lines)}/{self.detail_total_lines}{'' if complete else '+'}]"
+            try:
+                stdscr.addstr(max_height - 1, x_offset + 1, scroll_indicator, curses.A_REVERSE)
+            except curses.error:
+                pass
+
+    def _get_detail_lines(self, ticket_key: str, ticket: dict, max_width: int,
+                          min_lines: int) -> Tuple[List[tuple], bool]:
+        """
+        Get the tagged (tag, text) lines shown in the detail pane for a ticket.
+
+        Lines are laid out lazily by _iter_detail_lines, only as far as the pane
+        needs: the returned list holds at least min_lines lines unless the ticket
+        has fewer, so a ticket with hundreds of history entries doesn't wrap
+        them all to show its first screen. Returns (lines, complete), complete
+        being False while more lines remain to be laid out.
+
+        Formatting and wrapping are pure in (ticket, show_full, width), so the
+        layout (and the generator resuming it) is memoized and redraws (scrolling,
+        loading ticks, overlays) only slice it. An entry is reused only while the
+        cache still holds the same ticket dict - refreshes, transitions and
+        comments replace the dict, which invalidates it without explicit
+        clearing. The least recently shown entries are evicted beyond
+        _DETAIL_CACHE_SIZE.
+        """
+        cache_key = (ticket_key, self.show_full, max_width)
+        cached = self._detail_lines_cache.get(cache_key)
+        if cached is None or cached[0] is not ticket:
+            cached = [ticket, [], self._iter_detail_lines(ticket, max_width, self.show_full)]
+            self._detail_lines_cache[cache_key] = cached
+            if len(self._detail_lines_cache) > self._DETAIL_CACHE_SIZE:
+                self._detail_lines_cache.popitem(last=False)
+        self._detail_lines_cache.move_to_end(cache_key)  # Most recently shown last
+
+        _, lines, pending = cached
+        if pending is not None and len(lines) < min_lines:
+            lines.extend(islice(pending, min_lines - len(lines)))
+            if len(lines) < min_lines:
+                cached[2] = pending = None  # Laid out to the end
+        return lines, pending is None
+
+    def _iter_detail_lines(self, ticket: dict, max_width: int, show_full: bool):
+        """Lay out the detail pane for a ticket, yielding (tag, text) lines top to bottom."""
         # Use shared formatting logic from viewer
-        lines = self.viewer.format_ticket_detail_lines(ticket, max_width)
+        yield from self.viewer.format_ticket_detail_lines(ticket, max_width)
 
         # Add issuelinks info
         fields = ticket.get('fields', {})
@@ -4681,7 +5253,7 @@ class JiraTUI:
 
         # Linked issues - group by relationship type
         if issuelinks:
-            lines.append(("HEADER", (" Linked Issues:")[:max_width - 2]))
+            yield ("HEADER", (" Linked Issues:")[:max_width - 2])
 
             # Group links by relationship and direction
             grouped_links = {}
@@ -4703,7 +5275,7 @@ class JiraTUI:
 
             # Display grouped links
             for direction, issues in sorted(grouped_links.items()):
-                lines.append(("", f"  {direction}:"[:max_width - 2]))
+                yield ("", f"  {direction}:"[:max_width - 2])
 
                 for linked_issue in issues:
                     linked_key = linked_issue.get('key', 'Unknown')
@@ -4721,159 +5293,254 @@ class JiraTUI:
                         if remaining > 20:
                             link_text += f": {linked_summary[:remaining]}"
 
-                    lines.append((f"STATUS_{status_letter}", link_text[:max_width - 2]))
+                    yield (f"STATUS_{status_letter}", link_text[:max_width - 2])
 
-        lines.append(("", ""))
+        yield ("", "")
 
         # Description
         description = fields.get('description')
         if description:
-            lines.append(("HEADER", (" Description:")[:max_width - 2]))
-            desc_lines = self.viewer.format_description_lines(description, indent="")
+            yield ("HEADER", (" Description:")[:max_width - 2])
+            # ADF -> tagged lines is a pure function of the description, so format
+            # once per ticket and keep the result on the ticket dict (a refresh
+            # replaces the dict, which drops the cached copy)
+            desc_lines = ticket.get('_formatted_description')
+            if desc_lines is None:
+                desc_lines = self.viewer.format_description_lines(description, indent="")
+                ticket['_formatted_description'] = desc_lines
             # Wrap description lines, preserving tags
             for tag, line in desc_lines:
                 if tag == "CODE":
                     # Code lines: don't wrap, just add with CODE tag
-                    lines.append((tag, f"  {line}"[:max_width - 2]))
+                    yield (tag, f"  {line}"[:max_width - 2])
                 elif tag == "SEGMENTS":
                     # Segmented lines (with inline styling): prepend spaces to first segment
+                    # (build a new list - desc_lines is cached and must not be mutated)
                     segments = line
                     if segments:
                         first_tag, first_text = segments[0]
-                        segments[0] = (first_tag, f"  {first_text}")
-                    lines.append((tag, segments))
+                        segments = [(first_tag, f"  {first_text}")] + segments[1:]
+                    yield (tag, segments)
                 else:
                     # Normal text: wrap as before
-                    wrapped = self._wrap_text(line, max_width - 4)
-                    lines.extend([("", f"  {l}") for l in wrapped])
+                    for l in self._wrap_text(line, max_width - 4):
+                        yield ("", f"  {l}")
 
-        lines.append(("", ""))
+        yield ("", "")
 
         # Comments
         comments_data = fields.get('comment', {})
         all_comments = comments_data.get('comments', [])
 
         if all_comments:
-            if self.show_full:
+            if show_full:
                 comments_to_show = all_comments
-                lines.append(("HEADER", (f" ──── All Comments ({len(all_comments)}) ────")[:max_width - 2]))
+                yield ("HEADER", (f" ──── All Comments ({len(all_comments)}) ────")[:max_width - 2])
             else:
                 comments_to_show = self.viewer.filter_recent_comments(all_comments)
-                lines.append(("HEADER", (f" ──── Recent Comments ({len(comments_to_show)}/{len(all_comments)}) ────")[:max_width - 2]))
+                yield ("HEADER", (f" ──── Recent Comments ({len(comments_to_show)}/{len(all_comments)}) ────")[:max_width - 2])
 
             for comment in comments_to_show:
-                comment_text = self.viewer.format_comment(comment, False)
+                comment_text = comment.get('_formatted')
+                if comment_text is None:
+                    comment_text = self.viewer.format_comment(comment, False)
+                    comment['_formatted'] = comment_text
                 for line in comment_text.split('\n'):
-                    wrapped = self._wrap_text(line, max_width - 4)
-                    lines.extend([("", f"  {l}") for l in wrapped])
-                lines.append(("", ""))
+                    for l in _wrap_line(line, max_width - 4):
+                        yield ("", f"  {l}")
+                yield ("", "")
         else:
-            lines.append(("HEADER", (" ──── Comments ────")[:max_width - 2]))
-            lines.append(("", "  (No comments)"))
-            lines.append(("", ""))
+            yield ("HEADER", (" ──── Comments ────")[:max_width - 2])
+            yield ("", "  (No comments)")
+            yield ("", "")
 
         # History (only if full mode)
-        if self.show_full:
+        if show_full:
             changelog = ticket.get('changelog', {})
             histories = changelog.get('histories', [])
 
             if histories:
-                lines.append(("HEADER", (f" ──── Change History ({len(histories)}) ────")[:max_width - 2]))
+                yield ("HEADER", (f" ──── Change History ({len(histories)}) ────")[:max_width - 2])
                 for history in histories:
-                    history_lines = self.viewer.format_history_entry(history, False)
+                    # Formatted once per history entry, like comments (entries live on the ticket dict)
+                    history_lines = history.get('_formatted')
+                    if history_lines is None:
+                        history_lines = history['_formatted'] = self.viewer.format_history_entry(history, False)
                     for line in history_lines:
-                        wrapped = self._wrap_text(line, max_width - 4)
-                        lines.extend([("", f"  {l}") for l in wrapped])
-                    lines.append(("", ""))
+                        for l in _wrap_line(line, max_width - 4):
+                            yield ("", f"  {l}")
+                    yield ("", "")
 
-        # Store total lines for scroll tracking
-        self.detail_total_lines = len(lines)
 
-        # Draw visible lines with scrolling support
-        visible_lines = lines[self.detail_scroll_offset:self.detail_scroll_offset + max_height - 1]
+    def _flush_frame(self) -> None:
+        """Send all pending window changes to the terminal as one synchronized frame."""
+        fd = sys.stdout.fileno()
+        try:
+            os.write(fd, self._SYNC_BEGIN)
+        except OSError:
+            pass
+        curses.doupdate()  # ncurses flushes its own output buffer before returning
+        try:
+            os.write(fd, self._SYNC_END)
+        except OSError:
+            pass
 
-        for i, (tag, line) in enumerate(visible_lines):
-            # Handle segmented lines (inline styling)
-            if tag == "SEGMENTS":
-                # line is actually a list of (tag, text) segments
-                segments = line
-                x_pos = 0
-                for seg_tag, seg_text in segments:
-                    if seg_tag == "LINK":
-                        seg_attr = curses.color_pair(5)  # Cyan for links/mentions
-                    else:
-                        seg_attr = curses.A_NORMAL
+    @staticmethod
+    def _paint_pane(win, rows: dict, last_rows: dict) -> dict:
+        """
+        Repaint the rows of a pane window that changed since the last frame.
 
+        Args:
+            win: Pane window
+            rows: This frame's rows, as recorded by _PaneRecorder
+            last_rows: Rows painted last frame ({} after the window was recreated)
+
+        Returns:
+            rows, to pass back as last_rows next frame
+        """
+        for y, segments in rows.items():
+            if last_rows.get(y) != segments:
+                try:
+                    win.move(y, 0)
+                    win.clrtoeol()
+                except curses.error:
+                    continue  # Row below the window
+                for x, text, attr in segments:
                     try:
-                        # Only render what fits
-                        available = max_width - 2 - x_pos
-                        if available > 0:
-                            text_to_render = seg_text[:available]
-                            stdscr.addstr(i, x_offset + 1 + x_pos, text_to_render, seg_attr)
-                            x_pos += len(text_to_render)
+                        if isinstance(text, int):
+                            win.chgat(y, x, text, attr)
+                        else:
+                            win.addstr(y, x, text, attr)
                     except curses.error:
-                        pass
-                continue
+                        pass  # Clipped at the window edge
+        for y in last_rows:
+            if y not in rows:
+                try:
+                    win.move(y, 0)
+                    win.clrtoeol()
+                except curses.error:
+                    pass
+        return rows
 
-            # Determine color based on tag
-            if tag == "KEY":
-                attr = curses.color_pair(1) | curses.A_BOLD  # Green bold
-            elif tag == "SUMMARY":
-                attr = curses.A_BOLD  # Bold
-            elif tag == "HEADER":
-                attr = curses.color_pair(3)  # Blue
-            elif tag.startswith("STATUS_"):
-                # Map status letter to color (matching dashboard style)
-                status_letter = tag.split("_")[1]
-                attr = self._get_status_color(status_letter)
-            elif tag.startswith("PRIORITY_"):
-                # Map priority to color
-                priority = tag.split("_", 1)[1]
-                if priority in ['Critical', 'Blocker', 'Highest']:
-                    attr = curses.color_pair(4)  # Red
-                elif priority in ['High']:
-                    attr = curses.color_pair(2)  # Yellow
-                elif priority in ['Low', 'Lowest']:
-                    attr = curses.color_pair(3)  # Blue
-                else:
-                    attr = curses.A_NORMAL  # Medium/None
-            elif tag.startswith("DATE_"):
-                # Map relative date to color
-                color_num = tag.split("_")[1]
-                if color_num == '1':
-                    attr = curses.color_pair(1)  # Green (< 2 days)
-                elif color_num == '2':
-                    attr = curses.color_pair(2)  # Yellow (2-4 days)
-                else:
-                    attr = curses.A_NORMAL  # Normal (> 4 days)
-            elif tag == "WARN":
-                attr = curses.color_pair(4)  # Red for warnings/flags
-            elif tag == "CODE":
-                attr = curses.A_DIM  # Dim/grey for code blocks
-            else:
-                attr = curses.A_NORMAL
+    def _signal_loaded(self, ticket_key: str) -> None:
+        """Report a ticket a background thread just cached and wake the UI loop."""
+        self._loaded_keys.put(ticket_key)
+        self._wake_ui()
 
-            try:
-                stdscr.addstr(i, x_offset + 1, line[:max_width - 2], attr)
-            except curses.error:
-                pass
+    def _wake_ui(self) -> None:
+        """Wake the UI loop from select() (safe from any thread or signal handler)."""
+        if self._wake_w is None:
+            return
+        try:
+            os.write(self._wake_w, b'.')
+        except OSError:
+            pass  # Pipe full - a wake-up is already pending
 
-        # Show scroll indicator if content is scrolled
-        if self.detail_scroll_offset > 0 or self.detail_scroll_offset + max_height - 1 < self.detail_total_lines:
-            scroll_indicator = f"[{self.detail_scroll_offset + 1}-{min(self.detail_scroll_offset + max_height - 1, self.detail_total_lines)}/{self.detail_total_lines}]"
+    def _count_queued_repeats(self, stdscr, keys: tuple) -> int:
+        """
+        Consume further presses of a movement key already waiting in the input queue.
+
+        Holding j/k queues repeats faster than frames are drawn; applying them
+        together means one redraw per batch instead of one per repeat. The first
+        other key is pushed back for the main loop.
+
+        Returns:
+            Number of extra presses consumed
+        """
+        count = 0
+        stdscr.timeout(0)
+        try:
+            while True:
+                key = stdscr.getch()
+                if key == -1:
+                    break
+                if key not in keys:
+                    curses.ungetch(key)
+                    break
+                count += 1
+        finally:
+            stdscr.timeout(100)
+        return count
+
+    def _wait_for_input(self, stdscr) -> int:
+        """
+        Sleep until a key arrives or a background thread wakes the UI loop.
+
+        Replaces polling getch() every 100ms, so an idle TUI doesn't wake up at
+        all. Keys curses already buffered are returned without blocking; a
+        terminal resize is applied here and reported as KEY_RESIZE.
+
+        Returns:
+            The key pressed, or -1 when woken by a background signal
+        """
+        stdscr.timeout(0)
+        key = stdscr.getch()
+        if key == -1:
+            ready, _, _ = select.select([sys.stdin, self._wake_r], [], [])
+            if self._wake_r in ready:
+                try:
+                    while os.read(self._wake_r, 4096):
+                        pass
+                except BlockingIOError:
+                    pass
+                lines, cols = os.get_terminal_size(sys.stdin.fileno())
+                if curses.is_term_resized(lines, cols):
+                    curses.resizeterm(lines, cols)
+                    key = curses.KEY_RESIZE
+            if key == -1 and sys.stdin in ready:
+                stdscr.timeout(100)  # Room for the rest of an escape sequence
+                key = stdscr.getch()
+        stdscr.timeout(100)  # Dialogs still expect polling getch()
+        return key
+
+    def _drain_loaded_keys(self) -> set:
+        """Drain keys finished by background loaders since the last call (non-blocking)."""
+        loaded_keys = set()
+        while True:
             try:
-                stdscr.addstr(max_height - 1, x_offset + 1, scroll_indicator, curses.A_REVERSE)
-            except curses.error:
-                pass
+                loaded_keys.add(self._loaded_keys.get_nowait())
+            except queue.Empty:
+                return loaded_keys
+
+    def _get_loading_indicator(self) -> str:
+        """
+        Get the status bar loading indicator ('' once loading is complete).
+
+        Reads the loading counters without taking loading_lock: single attribute
+        reads are atomic under the GIL, and a momentarily stale count is only
+        shown until the next tick.
+        """
+        if self.loading_complete:
+            return ""
+        return f" [Loading {self.loading_count}/{self.loading_total}]"
+
+    def _set_status(self, stdscr, message: str) -> None:
+        """
+        Show a transient notice (e.g. "Loading tickets...") in the status bar row.
+
+        Replaces writing at the top-left corner, which left stale characters over
+        the list header. Flushed immediately because the caller is about to block
+        on a fetch; the next full redraw restores the normal status bar.
+        """
+        height, width = stdscr.getmaxyx()
+        try:
+            stdscr.move(height - 1, 0)
+            stdscr.clrtoeol()
+            stdscr.addnstr(height - 1, 0, f" {message}", width - 1, curses.A_REVERSE)
+            stdscr.chgat(height - 1, 0, -1, curses.A_REVERSE)
+        except curses.error:
+            pass
+        stdscr.noutrefresh()
+        curses.doupdate()
 
     def _draw_status_bar(self, stdscr, y: int, width: int, current: int,
                         total: int, search_query: str, input_buffer: str = ""):
         """Draw status bar at bottom showing commands and position."""
         # Left side: mode indicator and search status
         if self.backlog_mode:
-            status_left = " [BACKLOG: mN↑ MN↓ mm⭡ MM⭣ b=exit]"
+            status_left = self._STATUS_MODE_BACKLOG
         else:
-            status_left = f" [NORMAL] {current}/{total}"
+            status_left = f"{self._STATUS_MODE_NORMAL} {current}/{total}"
 
         # Add search indicator if active
         if search_query:
@@ -4884,24 +5551,26 @@ class JiraTUI:
             status_left += f" [{input_buffer}]"
 
         # Add loading indicator if still loading
-        with self.loading_lock:
-            if not self.loading_complete:
-                status_left += f" [Loading {self.loading_count}/{self.loading_total}]"
-
-        status_right = " q:quit j/k:move <n>j/k:<n> gg/G:top/bot <n>gg:line r:refresh e:edit t:transition f:flags c:comment w:weight v:browser ?:help "
-
-        # Calculate spacing
-        padding = width - len(status_left) - len(status_right)
-        status = status_left + " " * max(0, padding) + status_right
+        loading_indicator = self._get_loading_indicator()
+        self._last_loading_indicator = loading_indicator
+        status_left += loading_indicator
+
+        # Right-align the key hints in a single format (no padding string to build),
+        # reusing the last rendered line while the left side and width are unchanged
+        if (status_left, width) != self._status_cache_key:
+            status_right = self._STATUS_RIGHT
+            self._status_cache_str = f"{status_left}{status_right:>{max(len(status_right), width - len(status_left))}}"
+            self._status_cache_key = (status_left, width)
+        status = self._status_cache_str
 
         try:
             if self.use_colors:
                 # Determine the styled portion (mode indicator)
                 if self.backlog_mode:
-                    mode_text = " [BACKLOG: mN↑ MN↓ mm⭡ MM⭣ b=exit]"
+                    mode_text = self._STATUS_MODE_BACKLOG
                     mode_color = curses.color_pair(3) | curses.A_BOLD | curses.A_REVERSE
                 else:
-                    mode_text = " [NORMAL]"
+                    mode_text = self._STATUS_MODE_NORMAL
                     mode_color = curses.color_pair(2) | curses.A_BOLD | curses.A_REVERSE  # Green for normal
 
                 # Draw mode indicator in color
@@ -4916,128 +5585,286 @@ class JiraTUI:
         except curses.error:
             pass
 
-    def _draw_help(self, stdscr, height: int, width: int):
-        """Draw help overlay."""
-        help_text = [
-            "JIRA-VIEW INTERACTIVE MODE - HELP",
-            "",
-            "Navigation:",
-            "  j / ↓      Move down in list",
-            "  k / ↑      Move up in list",
-            "  g          Jump to top",
-            "  G          Jump to bottom",
-            "  Enter      Scroll detail pane down (1 line)",
-            "  \\          Scroll detail pane up (1 line)",
-            "  Ctrl+J     Scroll detail pane down (1 line)",
-            "  Ctrl+K     Scroll detail pane up (1 line)",
-            "  Ctrl+B     Scroll detail pane down (half-page)",
-            "  Ctrl+U     Scroll detail pane up (half-page)",
-            "",
-            "Actions:",
-            "  r          Refresh current view",
-            "  R          Refresh cache (link types, users)",
-            "  e          Edit ticket",
-            "  w          Edit story points (weight)",
-            "  f          Toggle flags",
-            "  F          Toggle full mode (all comments)",
-            "  b          Toggle backlog mode (rank ordering)",
-            "  v          Open ticket in browser",
-            "  y          Copy ticket URL to clipboard (yank)",
-            "  t          Transition ticket",
-            "  c          Add comment to ticket",
-            "  l          Manage issue links",
-            "  n          Create new issue",
-            "  d          Select saved dashboard",
-            "  s          New default query (JQL or ticket key)",
-            "  S          Edit default query",
-            "  /          Search/filter tickets",
-            "  ?          Show this help",
-            "  q          Quit",
-            "",
-            "Backlog Mode (press 'b' to toggle):",
-            "  mN         Move up N positions (e.g., m3)",
-            "  MN         Move down N positions (e.g., M2)",
-            "  mm / m0    Move to top",
-            "  MM         Move to bottom",
-            "",
-            "Press any key to close help"
-        ]
+    def _show_help(self, height: int, width: int):
+        """
+        Show the help popup over the panes (caller issues the single doupdate).
+
+        The popup window holds the static help text, so it is only composed
+        again when the terminal size changes; showing it again just re-flushes
+        its cells.
+        """
+        if self._help_win is None or self._help_geometry != (height, width):
+            # Centered box, clipped to the screen (every line fits a full-size box)
+            box_height = min(self._HELP_BOX_HEIGHT, height)
+            box_width = min(self._HELP_BOX_WIDTH, width)
+            start_y = max(0, (height - self._HELP_BOX_HEIGHT) // 2)
+            start_x = max(0, (width - self._HELP_BOX_WIDTH) // 2)
+            self._help_win = curses.newwin(box_height, box_width, start_y, start_x)
+            self._help_geometry = (height, width)
+
+            try:
+                self._help_win.box()
+                for i, line in enumerate(self._HELP_TEXT, start=1):
+                    attr = curses.A_BOLD if i == 1 else curses.A_NORMAL
+                    self._help_win.addnstr(i, 2, line, box_width - 4, attr)
+            except curses.error:
+                pass
+
+        # Mark every cell changed so the popup covers whatever the panes drew since
+        self._help_win.touchwin()
+        self._help_win.noutrefresh()
 
-        # Draw centered box
-        box_width = max(len(line) for line in help_text) + 4
-        box_height = len(help_text) + 2
-        start_y = (height - box_height) // 2
-        start_x = (width - box_width) // 2
+    def _inline_edit(self, stdscr, y: int, width: int, prompt: str, initial: str) -> Tuple[Optional[str], bool]:
+        """
+        Edit a single line of text in place on row y.
+
+        Saves the fork and terminal mode switch of $EDITOR for short edits such
+        as queries. Keys: Left/Right, Home/Ctrl-A, End/Ctrl-E, Backspace/Delete,
+        Enter to accept, ESC to cancel, Ctrl+X to continue in $EDITOR. Text
+        wider than the line scrolls horizontally with the cursor.
+
+        Returns:
+            (text, open_editor): the edited text, or None if cancelled; and
+            whether the user asked to continue in $EDITOR with that text
+        """
+        text = initial
+        cursor_pos = len(text)
+        field_x = len(prompt)
+        field_width = max(1, width - 1 - field_x)
+        curses.curs_set(1)
 
-        # Draw box
         try:
-            for i, line in enumerate(help_text):
-                y = start_y + i + 1
-                x = start_x + 2
-                if i == 0:  # Title
-                    stdscr.addstr(y, x, line[:box_width - 4], curses.A_BOLD)
-                else:
-                    stdscr.addstr(y, x, line[:box_width - 4])
-        except curses.error:
-            pass
+            while True:
+                # Scroll the field so the cursor stays visible
+                start = max(0, cursor_pos - field_width + 1)
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+                stdscr.chgat(y, 0, -1, curses.A_REVERSE)
+                stdscr.addstr(y, 0, (prompt + text[start:start + field_width])[:width - 1], curses.A_REVERSE)
+                stdscr.move(y, min(field_x + cursor_pos - start, width - 2))
+                stdscr.noutrefresh()
+                curses.doupdate()
+
+                ch = stdscr.getch()
+                while ch == -1:  # Input timeout; nothing to redraw
+                    ch = stdscr.getch()
 
-    def _get_search_input(self, stdscr, y: int, width: int) -> str:
-        """Get search input from user."""
-        curses.echo()
+                if ch == 27:  # ESC
+                    return None, False
+                elif ch in (10, 13):  # Enter
+                    return text, False
+                elif ch == 24:  # Ctrl+X - continue in $EDITOR
+                    return text, True
+                elif ch in (curses.KEY_BACKSPACE, 127, 8):
+                    if cursor_pos > 0:
+                        text = text[:cursor_pos - 1] + text[cursor_pos:]
+                        cursor_pos -= 1
+                elif ch == curses.KEY_DC:  # Delete
+                    text = text[:cursor_pos] + text[cursor_pos + 1:]
+                elif ch == curses.KEY_LEFT:
+                    cursor_pos = max(0, cursor_pos - 1)
+                elif ch == curses.KEY_RIGHT:
+                    cursor_pos = min(len(text), cursor_pos + 1)
+                elif ch == curses.KEY_HOME or ch == 1:  # Home or Ctrl-A
+                    cursor_pos = 0
+                elif ch == curses.KEY_END or ch == 5:  # End or Ctrl-E
+                    cursor_pos = len(text)
+                elif 32 <= ch < 127:  # Printable ASCII
+                    text = text[:cursor_pos] + _CHR128[ch] + text[cursor_pos:]
+                    cursor_pos += 1
+        finally:
+            curses.curs_set(0)
+
+    def _get_search_input(self, stdscr, y: int, width: int, tickets: List[dict]) -> Tuple[str, List[dict]]:
+        """
+        Get search input from user, filtering tickets incrementally as they type.
+
+        Typing a character can only narrow the match set, so each keystroke filters
+        the previous matches rather than the full list; backspace pops back to the
+        previous result. Returns (query, filtered tickets) - the full list when the
+        query is empty or matches nothing.
+
+        Keys are not echoed by curses; each keystroke rewrites only the cells
+        of the status line that differ from what is already shown.
+        """
         curses.curs_set(1)
 
         try:
-            # Clear the status line (use width - 1 to avoid curses boundary error)
-            stdscr.addstr(y, 0, " " * (width - 1), curses.A_REVERSE)
-            stdscr.addstr(y, 0, "Search: ", curses.A_REVERSE)
+            # Clear the status line and paint it reverse-video without writing a blank string
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+            stdscr.chgat(y, 0, -1, curses.A_REVERSE)
+            shown = "Search: "
+            stdscr.addstr(y, 0, shown, curses.A_REVERSE)
             stdscr.refresh()
 
             # Get input (simplified - just use getch loop)
+            # Characters go in a mutable buffer; search is materialized once per keystroke.
+            # matches[i] holds the tickets matching the first i characters.
+            buf = []
             search = ""
+            matches = [tickets]
+            key_actions = {
+                10: 'accept', 13: 'accept',  # Enter
+                27: 'cancel',  # Escape
+                curses.KEY_BACKSPACE: 'backspace', 127: 'backspace',
+            }
             while True:
                 ch = stdscr.getch()
-                if ch == 10 or ch == 13:  # Enter
+                action = key_actions.get(ch)
+                if action == 'accept':
                     break
-                elif ch == 27:  # Escape
+                elif action == 'cancel':
+                    buf.clear()
                     search = ""
+                    del matches[1:]
                     break
-                elif ch == curses.KEY_BACKSPACE or ch == 127:
-                    search = search[:-1]
-                elif 32 <= ch <= 126:  # Printable characters
-                    search += chr(ch)
-
-                # Update display (truncate to fit width)
-                stdscr.addstr(y, 0, " " * (width - 1), curses.A_REVERSE)
-                display_text = f"Search: {search}"[:width - 1]
-                stdscr.addstr(y, 0, display_text, curses.A_REVERSE)
-                stdscr.refresh()
+                elif action == 'backspace':
+                    if buf:
+                        buf.pop()
+                        search = "".join(buf)
+                        matches.pop()
+                elif ch == 32 and not buf:  # Ignore leading spaces
+                    pass
+                elif 32 <= ch < 127:  # Printable characters
+                    buf.append(_CHR128[ch])
+                    search = "".join(buf)
+                    matches.append(self._match_tickets(matches[-1], search))
+
+                # Update display (truncate to fit width), leaving the cursor after the query.
+                # Only the tail that differs from the previous text is rewritten.
+                prompt = f"Search: {search}"
+                display_text = f"{prompt}  ({len(matches[-1])} matches)" if search else prompt
+                display_text = display_text[:width - 1]
+                same = 0
+                for old_ch, new_ch in zip(shown, display_text):
+                    if old_ch != new_ch:
+                        break
+                    same += 1
+                if same < len(display_text):
+                    stdscr.addstr(y, same, display_text[same:], curses.A_REVERSE)
+                if len(display_text) < len(shown):
+                    # Blank the leftover cells, keeping the line reverse-video
+                    stdscr.move(y, len(display_text))
+                    stdscr.clrtoeol()
+                    stdscr.chgat(y, len(display_text), -1, curses.A_REVERSE)
+                shown = display_text
+                stdscr.move(y, min(len(prompt), width - 2))
+                stdscr.noutrefresh()
+                curses.doupdate()
         finally:
-            curses.noecho()
             curses.curs_set(0)
 
-        return search.strip()
+        # Leading spaces are never accepted, and the query without trailing spaces is
+        # a prefix of what was typed, so its matches are already on the stack
+        query = search.rstrip(' ')
+        return query, matches[len(query)] or tickets
 
     def _filter_tickets(self, tickets: List[dict], query: str) -> List[dict]:
-        """Filter tickets by search query (case-insensitive)."""
+        """
+        Filter tickets by search query (case-insensitive).
+
+        Returns the same tickets list object (not a copy) when the query is empty
+        or matches nothing, so callers can compare by identity.
+        """
+        if not query:
+            return tickets
+        return self._match_tickets(tickets, query) or tickets
+
+    def _match_tickets(self, tickets: List[dict], query: str) -> List[dict]:
+        """
+        Return the tickets whose key or summary contains query (case-insensitive).
+
+        Only the list indexed by _build_search_index is scanned. Narrowed results
+        (each search keystroke filters the previous matches) are tested per ticket:
+        they are used once, so indexing them would cost as much as the test and
+        evict the loaded list's index.
+        """
         query_lower = query.lower()
-        filtered = []
+        scan = self._search_scan
+        if scan is not None and scan[0] is tickets:
+            return self._scan_tickets(tickets, query_lower)
+        return [ticket for ticket in tickets if query_lower in self._get_search_blob(ticket)]
 
-        for ticket in tickets:
-            key = ticket.get('key', '').lower()
-            summary = ticket.get('fields', {}).get('summary', '').lower()
+    def _scan_tickets(self, tickets: List[dict], query_lower: str) -> List[dict]:
+        """
+        Match a large ticket list with C-level str.find over one joined search text.
+
+        The newline-joined search blobs and their start offsets are cached for the
+        indexed list; the cache is reused only while that list still holds the
+        same ticket objects (entries replaced after an edit force a rebuild). Each
+        hit is mapped back to its ticket by binary search, then the scan resumes
+        at the next ticket so a ticket is returned at most once. Broad queries
+        (many hits) fall back to the per-ticket test.
+        """
+        scan = self._search_scan
+        if scan[1] != tickets:
+            scan = self._build_search_index(tickets)
+
+        _, _, text, starts = scan
+        if text.count(query_lower) * 8 > len(tickets):
+            # Broad query: per-hit bisect costs more than testing each ticket
+            return [ticket for ticket in tickets if query_lower in self._get_search_blob(ticket)]
+
+        matched = []
+        pos = text.find(query_lower)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            matched.append(tickets[idx])
+            if idx + 1 == len(starts):
+                break
+            pos = text.find(query_lower, starts[idx + 1])
+        return matched
+
+    def _build_search_index(self, tickets: List[dict]) -> Optional[tuple]:
+        """
+        Precompute the search text for a ticket list.
 
-            if query_lower in key or query_lower in summary:
-                filtered.append(ticket)
+        Called when a query's tickets are cached, so the first search keystroke
+        doesn't pay for it: fills every ticket's search blob and, for lists large
+        enough to be scanned, the joined text and start offsets _scan_tickets uses.
 
-        return filtered if filtered else tickets
+        Returns:
+            The (tickets, snapshot of its entries, joined text, start offsets)
+            scan index, or None for small lists
+        """
+        blobs = [self._get_search_blob(ticket) for ticket in tickets]
+        if len(tickets) < self._SEARCH_SCAN_MIN_TICKETS:
+            self._search_scan = None
+            return None
+
+        starts = []
+        offset = 0
+        for blob in blobs:
+            starts.append(offset)
+            offset += len(blob) + 1
+        self._search_scan = (tickets, list(tickets), "\n".join(blobs), starts)
+        return self._search_scan
+
+    @staticmethod
+    def _get_search_blob(ticket: dict) -> str:
+        """
+        Get the lowercased "key\x00summary" text searched by _filter_tickets.
+
+        Cached on the ticket dict so each keystroke costs one substring test per
+        ticket. Refreshed tickets are new dicts, so the cache never goes stale. The
+        NUL separator keeps a query from matching across the key/summary boundary.
+        """
+        blob = ticket.get('_search_blob')
+        if blob is None:
+            key = ticket.get('key', '')
+            summary = ticket.get('fields', {}).get('summary', '')
+            blob = ticket['_search_blob'] = f"{key}\x00{summary}".lower()
+        return blob
 
     def _strip_ansi(self, text: str) -> str:
         """Strip ANSI color codes from text."""
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        # Most lines carry no escapes at all; a C-level substring test skips the regex walk
+        if '\x1b' not in text:
+            return text
+        return _ANSI_ESCAPE_RE.sub('', text)
 
-    def _wrap_text(self, text: str, width: int) -> List[str]:
+    def _wrap_text(self, text: str, width: int) -> Sequence[str]:
         """Wrap text respecting word boundaries."""
         if not text:
             return ['']
@@ -5045,31 +5872,31 @@ class JiraTUI:
         if len(text) <= width:
             return [text]
 
-        # Use textwrap for proper word-boundary wrapping
-        return textwrap.wrap(text, width=width, break_long_words=True, break_on_hyphens=False)
+        # A single unbreakable token (long URL, stack trace frame) is just sliced;
+        # textwrap would tokenize it only to fall back to the same break_long_words split
+        if not _WHITESPACE_RE.search(text):
+            return [text[i:i + width] for i in range(0, len(text), width)]
+
+        # Use textwrap for proper word-boundary wrapping (memoized per (text, width))
+        return _wrap_cached(text, width)
 
     def _open_in_browser(self, ticket_key: str):
-        """Open ticket in browser using xdg-open."""
+        """Open ticket in browser using the browser detected at startup."""
         # Construct Jira URL
-        url = f"https://indeed.atlassian.net/browse/{ticket_key}"
+        url = self._jira_browse_base + ticket_key
 
         try:
-            # Try xdg-open (Linux), open (Mac), or start (Windows)
-            if sys.platform.startswith('linux'):
-                subprocess.run(['xdg-open', url], check=False)
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', url], check=False)
-            elif sys.platform == 'win32':
-                subprocess.run(['start', url], shell=True, check=False)
+            # webbrowser handles platform dispatch (xdg-open, open, start) and reuses a
+            # running browser where it can; opens in a new tab without blocking
+            if self._browser is not None:
+                self._browser.open(url, new=2, autoraise=True)
         except Exception:
             # Silently fail - TUI will continue running
             pass
 
     def _copy_url_to_clipboard(self, ticket_key: str) -> tuple:
         """Copy ticket URL to clipboard. Returns (success, error_msg)."""
-        # Get Jira URL from environment, fallback to default
-        jira_url = os.environ.get('JIRA_URL', 'https://indeed.atlassian.net')
-        url = f"{jira_url}/browse/{ticket_key}"
+        url = self._jira_browse_base + ticket_key
 
         last_error = None
 
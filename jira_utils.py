@@ -5,21 +5,234 @@ Jira Utilities - Shared functionality for Jira dashboard tools
 Common functions for API calls, pagination, formatting, and display
 """
 
+import base64
+import configparser
+import hashlib
+import http.client
 import json
 import os
+import posixpath
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+from urllib.request import getproxies_environment, proxy_bypass_environment
 
 from jira_sqlite_cache import JiraSQLiteCache
 
+# orjson parses large search pages several times faster; optional, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Parse a JSON response body (bytes or str), with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # Anything orjson rejects (e.g. invalid UTF-8) gets stdlib's verdict
+    if isinstance(data, bytes):
+        data = data.decode('utf-8', errors='replace')
+    return json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def _parse_jira_datetime(value: str) -> datetime:
+    """
+    Parse a Jira timestamp (2025-09-26T14:10:21.467-0500) to a UTC datetime.
+
+    Memoized: the same strings come back on every dashboard row and redraw
+    (sprint start dates are shared by every ticket in the sprint). Raises
+    ValueError for unparseable input.
+    """
+    # Python 3.11+ reads Jira's -0500 offsets as-is; older versions raise and take
+    # the rewrite below
+    try:
+        return datetime.fromisoformat(value).astimezone(timezone.utc)
+    except ValueError:
+        pass
+
+    # Fix timezone format for Python compatibility: -0500 -> -05:00, Z -> +00:00
+    if value.count(':') == 2 and ('+' in value[-5:] or '-' in value[-5:]):
+        value = value[:-2] + ':' + value[-2:]
+    elif value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value).astimezone(timezone.utc)
+
+
+# Status name -> single letter indicator
+_STATUS_LETTERS = {
+    'Pending Triage': 'T',
+    'on Backlog': 'B',
+    'To Do': 'T',
+    'In Progress': 'P',
+    'In Review': 'R',
+    'Pending Review': 'R',
+    'Pending Requirements': 'Q',
+    'Pending Verification': 'V',
+    'Pending Closure': 'Z',
+    'Pending Deploy': 'Y',  # Changed from W to Y
+    'Pending Merge': 'M',
+    'Wish List': 'W',  # New W for Wish List
+    'Accepted': 'A',
+    'Scheduled': 'S',
+    'Done': 'C',  # Use C for Closed/Done to free up D
+    'Closed': 'C',
+    'Deferred': 'D',  # Use D for Deferred (red)
+    'Abandoned': '_',  # Use _ for Abandoned (red)
+    'Blocked': 'X'
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_due_date(due_date_str: str) -> Optional[datetime]:
+    """
+    Parse a Jira due date (YYYY-MM-DD); None if missing or invalid.
+
+    Memoized: strptime is slow and due dates repeat across a board.
+    """
+    if due_date_str:
+        try:
+            return datetime.strptime(due_date_str, '%Y-%m-%d')
+        except:
+            pass
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _format_due_date_prefix(due_date_str: str) -> str:
+    """Format a due date (YYYY-MM-DD) as a line prefix; ????-??-?? if missing or invalid."""
+    due_date = _parse_due_date(due_date_str)
+    if due_date:
+        formatted_date = due_date.strftime('%Y-%m-%d')
+        return f'{formatted_date} '
+    else:
+        return '????-??-?? '
+
+
+def _rank_sort_key(issue: dict) -> Tuple[str, str]:
+    """Sort key for Jira rank (customfield_10022); unranked issues go last by key number."""
+    rank = issue.get('fields', {}).get('customfield_10022', '')
+
+    if rank and '|' in rank and ':' in rank:
+        # Extract rank part after pipe: 'hzzwg1:000i'
+        rank_part = rank.split('|', 2)[1]
+        prefix, colon, suffix = rank_part.partition(':')
+        if colon:
+            # For Jira rank ordering, treat as pure string comparison
+            # Jira's rank values are designed to sort lexicographically
+            return (prefix, suffix.rstrip(':'))
+
+    # Fallback to issue key for consistent ordering
+    issue_key = issue.get('key', 'ZZZZ-9999')
+    issue_num = issue_key.rpartition('-')[2] if '-' in issue_key else '9999'
+    return ('zzz_fallback', issue_num.zfill(10))
+
+
+@lru_cache(maxsize=256)
+def _status_bucket(status_name: str, status_category: str) -> str:
+    """Dashboard bucket for a status: done, blocked, todo, in_progress, in_review or other.
+
+    Memoized: a project has a handful of (name, category) pairs, so each issue
+    costs one lookup instead of repeated lower() and substring checks.
+    """
+    lowered = status_name.lower()
+    if status_category == 'done' or status_name in ['Pending Verification', 'Abandoned']:
+        return 'done'
+    elif 'blocked' in lowered:
+        return 'blocked'
+    elif status_category == 'new' or 'triage' in lowered or 'backlog' in lowered:
+        return 'todo'
+    elif status_category == 'indeterminate' or 'progress' in lowered:
+        return 'in_progress'
+    elif 'review' in lowered:
+        return 'in_review'
+    else:
+        return 'other'
+
+
+# Status letter -> ANSI color: green closed/done/verification/closure/deploy/merge,
+# blue accepted/backlog/scheduled/wishlist, yellow active/pending/triage,
+# red deferred/blocked/abandoned. Unknown (?) stays uncolored.
+_STATUS_LETTER_COLORS = {
+    'C': '32', 'V': '32', 'Z': '32', 'Y': '32', 'M': '32',
+    'A': '34', 'B': '34', 'S': '34', 'W': '34',
+    'P': '33', 'R': '33', 'Q': '33', 'T': '33',
+    'D': '31', 'X': '31', '_': '31',
+}
+
+def build_status_indicators(letter_colors: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Build status indicator tables: letter -> [L], plain and ANSI-colored.
+
+    Covers the letters in letter_colors (letter -> ANSI color code) plus an
+    uncolored [?] for unknown statuses, so lookups are a dict hit per ticket.
+
+    Returns:
+        Tuple of (plain, colored) dicts
+    """
+    plain = {letter: f'[{letter}]' for letter in (*letter_colors, '?')}
+    colored = {
+        letter: f'\033[{letter_colors[letter]}m{indicator}\033[0m' if letter in letter_colors else indicator
+        for letter, indicator in plain.items()
+    }
+    return plain, colored
+
+
+# Status indicators built once, with and without color
+_STATUS_INDICATORS_PLAIN, _STATUS_INDICATORS_COLOR = build_status_indicators(_STATUS_LETTER_COLORS)
+
+
+@lru_cache(maxsize=128)
+def _format_days_with_color(days: int, days_text: str, use_colors: bool) -> str:
+    """Format (days_text), green under 2 days and yellow up to 4 when use_colors."""
+    if use_colors:
+        if days < 2:
+            return f'\033[32m({days_text})\033[0m'  # Green < 2 days
+        elif days <= 4:
+            return f'\033[33m({days_text})\033[0m'  # Yellow 2-4 days
+        else:
+            return f'({days_text})'  # Standard (no color) > 4 days
+    else:
+        return f'({days_text})'
+
+
+def _is_search_error(response) -> bool:
+    """True if a /search/jql response is a failed call or a Jira error body, not a page."""
+    return not isinstance(response, dict) or 'issues' not in response or 'errorMessages' in response
+
 
 class JiraUtils:
     """Shared utilities for Jira API interactions and display formatting."""
 
+    # Direct API calls: responses worth retrying (rate limited, gateway trouble), how
+    # often, and the backoff between tries. Only 429 is retried for non-GET requests
+    # other than read-only searches; a 5xx from a gateway may come after the server
+    # already applied the change.
+    _RETRY_STATUSES = frozenset((429, 502, 503, 504))
+    _READ_ONLY_POSTS = frozenset(('/search/jql', '/search/approximate-count'))
+    _API_RETRIES = 3
+    _API_BACKOFF = 0.3  # Seconds, doubled per retry
+    _MAX_RETRY_AFTER = 10  # Cap on a server-requested Retry-After, in seconds
+
+    # Full-issue pages fetched concurrently once the count pass has the keys
+    _FETCH_WORKERS = 8
+
+    # Issues requested per /search/jql page. Servers may return fewer (Jira Cloud caps
+    # pages that carry more than keys); the walk then shrinks to what came back.
+    _JQL_BATCH_SIZE = 500
+    _JQL_KEY_BATCH_SIZE = 5000  # Key-only pages: the most Jira Cloud returns per page
+
     def __init__(self, script_dir: Path = None):
         self.script_dir = script_dir or Path(__file__).parent
         self.jira_api = self.script_dir / "jira-api"
@@ -28,9 +241,24 @@ class JiraUtils:
         jira_url = os.environ.get('JIRA_URL', 'https://indeed.atlassian.net')
         self.cache = JiraSQLiteCache(jira_url)
 
+        # Direct HTTP client for call_jira_api: one keep-alive connection per thread
+        # (http.client connections are not thread-safe), reusing TCP+TLS across calls
+        self._api_url = urlsplit(f"{jira_url.rstrip('/')}/rest/api/3")
+        self._api_headers = self._resolve_api_headers()  # None = fall back to jira-api script
+        self._http_local = threading.local()
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None  # Created on first parallel fetch
+        self._jql_page_cap: Optional[int] = None  # Largest full-issue page the server returned
+
+        # Parsed GET responses for callers that pass cache_ttl: endpoint -> (expires, response)
+        self._api_response_cache: Dict[str, Tuple[float, object]] = {}
+
         # Current user cache (accountId of the authenticated user)
         self._current_user_id: Optional[str] = None
 
+        # How get_jql_count asks for a count ('approximate' on Cloud, 'search' on
+        # Server/DC); None until a probe succeeds
+        self._count_method: Optional[str] = None
+
     def get_terminal_width(self) -> int:
         """Get terminal width, fallback to generous default for modern terminals."""
         try:
@@ -58,7 +286,145 @@ class JiraUtils:
         else:
             return available_space
 
-    def call_jira_api(self, endpoint: str, method: str = "GET", data: Optional[dict] = None) -> Optional[dict]:
+    def _resolve_api_headers(self) -> Optional[Dict[str, str]]:
+        """Resolve request headers for direct API calls, mirroring jira-api's get_token.
+
+        Returns None when the jira-api script must be used instead: custom
+        CURL_OPTS, a proxy (https_proxy/all_proxy, which curl honors and the
+        direct connection doesn't), a token that only lives in the macOS
+        keychain (or has to be prompted for), or JIRA_USE_SCRIPT=true.
+        """
+        if os.environ.get('JIRA_USE_SCRIPT', 'false').lower() == 'true':
+            return None
+        if os.environ.get('CURL_OPTS', '-s') != '-s':
+            return None
+        proxies = getproxies_environment()
+        if ((proxies.get(self._api_url.scheme) or proxies.get('all'))
+                and not proxy_bypass_environment(self._api_url.hostname or '', proxies)):
+            return None
+
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        if os.environ.get('JIRA_NO_AUTH', 'false') == 'true':
+            return headers
+
+        token = os.environ.get('JIRA_TOKEN')
+        if token is None:
+            try:
+                token = (Path.home() / '.atlassian-mcp-token').read_text().replace('\n', '') or None
+            except OSError:
+                token = None
+        if token is None:
+            return None
+
+        if token:
+            user = os.environ.get('TOKEN_ACCOUNT') or os.environ.get('LDAPUSER', '')
+            account = f"{user}@{os.environ.get('EMAIL_DOMAIN', 'indeed.com')}"
+            credentials = base64.b64encode(f"{account}:{token}".encode()).decode('ascii')
+            headers['Authorization'] = f"Basic {credentials}"
+        return headers
+
+    def _api_request(self, method: str, endpoint: str, body: Optional[bytes]) -> Tuple[int, bytes, Optional[str]]:
+        """
+        Send one request on this thread's keep-alive connection.
+
+        Returns (status, body, Retry-After header or None).
+        """
+        # Same URL the script builds; normalize so relative endpoints like
+        # ../../agile/1.0/... resolve as curl would
+        path, _, query = f"{self._api_url.path.rstrip('/')}/{endpoint.lstrip('/')}".partition('?')
+        url = posixpath.normpath(path) + (f"?{query}" if query else "")
+
+        conn = getattr(self._http_local, 'conn', None)
+        reused = conn is not None
+        if conn is None:
+            connection_class = (http.client.HTTPSConnection if self._api_url.scheme == 'https'
+                                else http.client.HTTPConnection)
+            conn = connection_class(self._api_url.netloc, timeout=30)
+
+        try:
+            conn.request(method, url, body=body, headers=self._api_headers)
+            response = conn.getresponse()
+            payload = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            self._http_local.conn = None
+            if not reused:
+                raise
+            # Server closed the idle keep-alive connection - retry once on a fresh one
+            return self._api_request(method, endpoint, body)
+        except Exception:
+            conn.close()
+            self._http_local.conn = None
+            raise
+
+        self._http_local.conn = None if response.will_close else conn
+        if response.will_close:
+            conn.close()
+        return response.status, payload, response.getheader('Retry-After')
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to wait before retry number attempt + 1 (server's Retry-After if given)."""
+        try:
+            return min(float(retry_after), self._MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            return self._API_BACKOFF * (2 ** attempt)
+
+    def call_jira_api(self, endpoint: str, method: str = "GET", data: Optional[dict] = None,
+                      cache_ttl: Optional[float] = None) -> Optional[dict]:
+        """Call the Jira REST API and return parsed JSON response.
+
+        Uses a direct keep-alive HTTP connection when credentials are available
+        without the script (JIRA_TOKEN, ~/.atlassian-mcp-token or JIRA_NO_AUTH);
+        otherwise runs the jira-api script. Rate limiting (429) and gateway
+        errors (502-504, GET and POST /search/jql only) are retried with
+        backoff. Like the script's curl call, any other HTTP status returns the
+        parsed body (Jira error JSON included).
+
+        With cache_ttl (seconds), a GET's parsed response is kept in memory and
+        returned as-is for repeat calls to the same endpoint until it expires, so
+        callers must not modify it. Failed calls and Jira error responses are not
+        cached. Paging URLs (nextPageToken) are never cached.
+        """
+        if not cache_ttl or method != "GET" or 'nextPageToken=' in endpoint:
+            return self._request_jira_api(endpoint, method, data)
+
+        cached = self._api_response_cache.get(endpoint)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        response = self._request_jira_api(endpoint)
+        if response is not None and not (isinstance(response, dict) and 'errorMessages' in response):
+            self._api_response_cache[endpoint] = (time.monotonic() + cache_ttl, response)
+        return response
+
+    def clear_cache(self) -> None:
+        """Drop all in-memory API responses cached via call_jira_api(cache_ttl=...)."""
+        self._api_response_cache.clear()
+
+    def _request_jira_api(self, endpoint: str, method: str = "GET", data: Optional[dict] = None) -> Optional[dict]:
+        """Make one call_jira_api request, bypassing the response cache."""
+        if self._api_headers is None:
+            return self._call_jira_api_script(endpoint, method, data)
+
+        try:
+            body = json.dumps(data).encode() if data is not None else None
+            for attempt in range(self._API_RETRIES + 1):
+                status, payload, retry_after = self._api_request(method, endpoint, body)
+                if (attempt == self._API_RETRIES or status not in self._RETRY_STATUSES
+                        or (status != 429 and method != "GET" and endpoint not in self._READ_ONLY_POSTS)):
+                    break
+                time.sleep(self._retry_delay(attempt, retry_after))
+
+            # Some POST requests return empty response (e.g., transitions)
+            if not payload.strip():
+                return {}
+
+            return _loads(payload)
+        except Exception as e:
+            print(f"❌ Error calling Jira API: {e}", file=sys.stderr)
+            return None
+
+    def _call_jira_api_script(self, endpoint: str, method: str = "GET", data: Optional[dict] = None) -> Optional[dict]:
         """Call jira-api script and return parsed JSON response."""
         try:
             cmd = [str(self.jira_api), method, endpoint]
@@ -77,28 +443,53 @@ class JiraUtils:
             if not result.stdout.strip():
                 return {}
 
-            return json.loads(result.stdout)
+            return _loads(result.stdout)
         except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
             print(f"❌ Error calling Jira API: {e}", file=sys.stderr)
             return None
 
     def get_jql_count(self, jql: str, stdscr=None) -> tuple:
-        """Get the total count of results for a JQL query by fetching only keys.
+        """Get the total count of results for a JQL query in one request.
 
-        This makes a fast query fetching minimal data (just keys) to determine
-        the total count before fetching full results.
+        Asks /search/approximate-count (Jira Cloud); where that endpoint doesn't
+        exist, /rest/api/2/search with maxResults=0 (Server/DC), which returns
+        the total without issues. The endpoint that answered is remembered. If
+        neither answers with a count (API errors), walks the query fetching
+        only keys.
 
         Args:
             jql: JQL query string
-            stdscr: Optional curses screen for progress display and interruption
+            stdscr: Optional curses screen for progress display and interruption of the key walk
 
         Returns:
             Tuple of (count, interrupted) where interrupted is True if user pressed a key
         """
-        jql_encoded = jql.replace(' ', '%20').replace('"', '%22')
-        count = 0
+        if self._count_method != 'search':
+            response = self.call_jira_api('/search/approximate-count', method='POST', data={'jql': jql})
+            if isinstance(response, dict) and isinstance(response.get('count'), int):
+                self._count_method = 'approximate'
+                return (response['count'], False)
+
+        if self._count_method != 'approximate':
+            response = self.call_jira_api(f"../2/search?jql={quote(jql, safe='')}&maxResults=0&fields=key")
+            if isinstance(response, dict) and isinstance(response.get('total'), int):
+                self._count_method = 'search'
+                return (response['total'], False)
+
+        keys, interrupted, _ = self._collect_jql_keys(jql, stdscr)
+        return (len(keys), interrupted)
+
+    def _collect_jql_keys(self, jql: str, stdscr=None, batch_size: int = _JQL_KEY_BATCH_SIZE) -> Tuple[List[str], bool, bool]:
+        """Walk a JQL query fetching only keys, in result order.
+
+        Returns:
+            Tuple of (keys, interrupted, complete); complete is False if a page failed
+        """
+        jql_encoded = quote(jql, safe='')
+        keys = []
+        complete = True
         next_page_token = None
-        max_results = 100
+        max_results = batch_size
 
         # Set up non-blocking input if we have a screen
         if stdscr:
@@ -111,27 +502,33 @@ class JiraUtils:
                     key = stdscr.getch()
                     if key != -1:  # Key was pressed
                         stdscr.nodelay(False)
-                        return (count, True)
+                        return (keys, True, False)
                 except:
                     pass
 
             # Build endpoint - fetch only 'key' field for speed
             if next_page_token:
-                endpoint = f"/search/jql?jql={jql_encoded}&fields=key&maxResults={max_results}&nextPageToken={next_page_token}"
+                endpoint = f"/search/jql?jql={jql_encoded}&fields=key&maxResults={max_results}&nextPageToken={quote(next_page_token, safe='')}"
             else:
                 endpoint = f"/search/jql?jql={jql_encoded}&fields=key&maxResults={max_results}"
 
             response = self.call_jira_api(endpoint)
-            if not response:
+            if _is_search_error(response):
+                complete = False
                 break
 
-            issues = response.get('issues', [])
+            issues = response['issues']
             next_page_token = response.get('nextPageToken')
 
             if not issues:
                 break
 
-            count += len(issues)
+            keys.extend(issue['key'] for issue in issues)
+            count = len(keys)
+
+            # Server capped the page below what we asked for: ask for that from now on
+            if next_page_token and len(issues) < max_results:
+                max_results = len(issues)
 
             # Update progress display
             if stdscr:
@@ -153,9 +550,9 @@ class JiraUtils:
         if stdscr:
             stdscr.nodelay(False)
 
-        return (count, False)
+        return (keys, False, complete)
 
-    def fetch_all_jql_results(self, jql: str, fields: List[str], max_items: int = 1000, expand: Optional[str] = None, progress_callback=None, skip_count: bool = False, stdscr=None) -> List[dict]:
+    def fetch_all_jql_results(self, jql: str, fields: List[str], max_items: int = 1000, expand: Optional[str] = None, progress_callback=None, skip_count: bool = False, stdscr=None, batch_size: int = _JQL_BATCH_SIZE, cache_ttl: Optional[int] = None, force_refresh: bool = False) -> List[dict]:
         """Fetch all results for a JQL query using proper nextPageToken pagination.
 
         Args:
@@ -166,19 +563,38 @@ class JiraUtils:
             progress_callback: Optional callback function(fetched_count, total_count) called after each page
             skip_count: If True, skip the initial count query (default False)
             stdscr: Optional curses screen for count progress and interruption
+            batch_size: Full issues requested per page; lowered if the server returns fewer
+            cache_ttl: If set, reuse a result cached on disk within this many seconds
+                (same query, fields, expand and max_items); JIRA_NO_CACHE=true disables
+            force_refresh: With cache_ttl, skip the cached result but still store the fresh one
 
         Returns:
             List of issue dictionaries
         """
-        jql_encoded = jql.replace(' ', '%20').replace('"', '%22')
+        if cache_ttl and os.environ.get('JIRA_NO_CACHE', 'false').lower() != 'true':
+            cache_key = hashlib.sha1(repr((self.cache.jira_url, jql, fields, expand, max_items, skip_count)).encode()).hexdigest()
+            cached = self.cache.get('jql_results', key=cache_key, force_refresh=force_refresh)
+            if cached is not None:
+                if progress_callback:
+                    progress_callback(len(cached), len(cached))
+                return cached
+
+            issues = self.fetch_all_jql_results(jql, fields, max_items, expand, progress_callback,
+                                                skip_count, stdscr, batch_size)
+            if issues:
+                # One row per query: drop expired ones so old queries don't pile up
+                self.cache.prune_expired('jql_results')
+                self.cache.set('jql_results', issues, ttl=cache_ttl, key=cache_key)
+            return issues
+
         fields_str = ','.join(fields)
         all_issues = []
-        next_page_token = None
-        max_results = 100
+        max_results = min(batch_size, self._jql_page_cap or batch_size)
 
         # Get total count first with a fast query (unless skipped)
         if not skip_count:
-            total_count, interrupted = self.get_jql_count(jql, stdscr)
+            keys, interrupted, complete = self._collect_jql_keys(jql, stdscr)
+            total_count = len(keys)
             if interrupted:
                 # User interrupted counting - only fetch what was counted so far
                 max_items = total_count
@@ -186,13 +602,74 @@ class JiraUtils:
                 # Full count completed and exceeds default limit - fetch all
                 max_items = total_count
             # Otherwise use the default max_items (1000)
+
+            # The key walk already fixed the result set and its order, so the full
+            # pages can be fetched side by side instead of token by token
+            if keys and (complete or interrupted):
+                issues, complete = self._fetch_issues_by_keys(keys[:max_items], fields, expand,
+                                                              progress_callback, total_count, max_results)
+                if complete:
+                    return issues
+                # A key page failed (e.g. an issue deleted or hidden since the key
+                # walk): fetch the query token by token instead
         else:
             total_count = None
 
+        for issues in self._iter_jql_pages(jql, fields_str, expand, max_results):
+            all_issues.extend(issues)
+
+            # Call progress callback if provided
+            if progress_callback and total_count is not None:
+                progress_callback(len(all_issues), total_count)
+
+            # Safety limit to prevent runaway queries
+            if len(all_issues) >= max_items:
+                break
+
+        return all_issues
+
+    def iter_jql_results(self, jql: str, fields: List[str], expand: Optional[str] = None,
+                         batch_size: int = _JQL_BATCH_SIZE) -> Iterator[dict]:
+        """Yield the issues for a JQL query as each page arrives.
+
+        Pages are fetched on demand, so a consumer that stops early (top-N,
+        first match) never requests the rest. A failed page ends the iteration.
+        """
+        max_results = min(batch_size, self._jql_page_cap or batch_size)
+        for issues in self._iter_jql_pages(jql, ','.join(fields), expand, max_results):
+            yield from issues
+
+    def fetch_issues_by_keys(self, keys: List[str], fields: List[str], expand: Optional[str] = None,
+                             progress_callback=None, batch_size: int = _JQL_BATCH_SIZE) -> List[dict]:
+        """Fetch full issues for known keys, several key pages at once.
+
+        Args:
+            keys: Issue keys to fetch; results come back in this order
+            fields: List of fields to fetch
+            expand: Optional expand parameter
+            progress_callback: Optional callback function(fetched_count, total_count) called as pages complete
+            batch_size: Keys requested per page; lowered if the server returns fewer
+
+        Returns:
+            List of issue dictionaries, or None if a page failed (a key that no
+            longer exists or is no longer visible fails its whole page)
+        """
+        if not keys:
+            return []
+        max_results = min(batch_size, self._jql_page_cap or batch_size)
+        issues, complete = self._fetch_issues_by_keys(keys, fields, expand, progress_callback,
+                                                      len(keys), max_results)
+        return issues if complete else None
+
+    def _iter_jql_pages(self, jql: str, fields_str: str, expand: Optional[str], max_results: int) -> Iterator[List[dict]]:
+        """Walk a JQL query by nextPageToken, yielding each non-empty page of issues."""
+        jql_encoded = quote(jql, safe='')
+        next_page_token = None
+
         while True:
             # Build endpoint with nextPageToken if we have one
             if next_page_token:
-                endpoint = f"/search/jql?jql={jql_encoded}&fields={fields_str}&maxResults={max_results}&nextPageToken={next_page_token}"
+                endpoint = f"/search/jql?jql={jql_encoded}&fields={fields_str}&maxResults={max_results}&nextPageToken={quote(next_page_token, safe='')}"
             else:
                 endpoint = f"/search/jql?jql={jql_encoded}&fields={fields_str}&maxResults={max_results}"
 
@@ -202,43 +679,102 @@ class JiraUtils:
 
             response = self.call_jira_api(endpoint)
             if not response:
-                return all_issues
+                return
 
             issues = response.get('issues', [])
             next_page_token = response.get('nextPageToken')
 
             # If no issues returned, we're done
             if not issues:
-                break
+                return
 
-            all_issues.extend(issues)
+            # Server capped the page below what we asked for: ask for that from now on
+            if next_page_token and len(issues) < max_results:
+                max_results = self._jql_page_cap = len(issues)
 
-            # Call progress callback if provided
-            if progress_callback and total_count is not None:
-                progress_callback(len(all_issues), total_count)
+            yield issues
 
             # If no nextPageToken, we're on the last page
             if not next_page_token:
-                break
+                return
 
-            # Safety limit to prevent runaway queries
-            if len(all_issues) >= max_items:
-                break
+    def _fetch_issues_by_keys(self, keys: List[str], fields: List[str], expand: Optional[str],
+                              progress_callback, total_count: int, max_results: int) -> Tuple[List[dict], bool]:
+        """Fetch full issues for known keys, max_results per request, several requests at once.
 
-        return all_issues
+        Pages are POSTed to /search/jql, so 500 keys don't make a 10 KB URL. Issues
+        come back in the order of keys. If a page fails (including a Jira error body),
+        only the pages before it are returned, matching the sequential walk's
+        behavior on error.
+
+        Returns:
+            Tuple of (issues, complete); complete is False if a page failed
+        """
+        pages = [keys[i:i + max_results] for i in range(0, len(keys), max_results)]
 
-    def calculate_days_since_update(self, updated_str: str) -> Tuple[int, str]:
-        """Calculate days since last update and return (days, formatted_string)."""
+        def fetch_page(page):
+            data = {'jql': f"key in ({','.join(page)})", 'fields': fields, 'maxResults': max_results}
+            if expand:
+                data['expand'] = expand
+            issues = []
+            while True:
+                response = self.call_jira_api('/search/jql', method='POST', data=data)
+                if _is_search_error(response):
+                    return None
+                page_issues = response['issues']
+                issues.extend(page_issues)
+                next_page_token = response.get('nextPageToken')
+                if not page_issues or not next_page_token:
+                    return issues
+                # Capped below max_results: remember it and pick up the rest of this page
+                self._jql_page_cap = len(page_issues)
+                data = dict(data, nextPageToken=next_page_token)
+
+        if len(pages) == 1:
+            results = [fetch_page(pages[0])]
+            if results[0] and progress_callback:
+                progress_callback(len(results[0]), total_count)
+        else:
+            # Pool threads live as long as this object, so each keeps its keep-alive connection
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(max_workers=self._FETCH_WORKERS,
+                                                      thread_name_prefix='jira-fetch')
+            futures = {self._fetch_pool.submit(fetch_page, page): i for i, page in enumerate(pages)}
+            results = [None] * len(pages)
+            fetched = 0
+            for future in as_completed(futures):
+                issues = future.result()
+                results[futures[future]] = issues
+                if issues:
+                    fetched += len(issues)
+                    if progress_callback:
+                        progress_callback(fetched, total_count)
+
+        position = {key: i for i, key in enumerate(keys)}
+        all_issues = []
+        for issues in results:
+            if issues is None:
+                return (all_issues, False)
+            all_issues.extend(sorted(issues, key=lambda issue: position.get(issue.get('key'), len(keys))))
+        return (all_issues, True)
+
+    def parse_jira_datetime(self, value: str) -> Optional[datetime]:
+        """Parse a Jira timestamp to a UTC datetime (memoized); None if missing or unparseable."""
         try:
-            # Parse ISO format: 2025-09-26T14:10:21.467-0500
-            # Fix timezone format for Python compatibility
-            if updated_str.count(':') == 2 and ('+' in updated_str[-5:] or '-' in updated_str[-5:]):
-                # Add colon to timezone: -0500 -> -05:00
-                updated_str = updated_str[:-2] + ':' + updated_str[-2:]
+            return _parse_jira_datetime(value)
+        except Exception:
+            return None
 
-            updated_dt = datetime.fromisoformat(updated_str)
-            now = datetime.now(timezone.utc)
-            days_diff = (now - updated_dt.astimezone(timezone.utc)).days
+    def calculate_days_since_update(self, updated_str: str, now: Optional[datetime] = None) -> Tuple[int, str]:
+        """Calculate days since last update and return (days, formatted_string).
+
+        Pass now (UTC) to measure a whole list against one clock reading.
+        """
+        try:
+            # Parse ISO format: 2025-09-26T14:10:21.467-0500
+            updated_dt = _parse_jira_datetime(updated_str)
+            now = now or datetime.now(timezone.utc)
+            days_diff = (now - updated_dt).days
 
             if days_diff == 0:
                 return days_diff, 'today'
@@ -251,60 +787,16 @@ class JiraUtils:
 
     def format_days_with_color(self, days: int, days_text: str, use_colors: bool) -> str:
         """Format days with appropriate color coding."""
-        if use_colors:
-            if days < 2:
-                return f'\033[32m({days_text})\033[0m'  # Green < 2 days
-            elif days <= 4:
-                return f'\033[33m({days_text})\033[0m'  # Yellow 2-4 days
-            else:
-                return f'({days_text})'  # Standard (no color) > 4 days
-        else:
-            return f'({days_text})'
+        return _format_days_with_color(days, days_text, use_colors)
 
     def get_status_letter(self, status_name: str) -> str:
         """Map status name to single letter indicator."""
-        status_map = {
-            'Pending Triage': 'T',
-            'on Backlog': 'B',
-            'To Do': 'T',
-            'In Progress': 'P',
-            'In Review': 'R',
-            'Pending Review': 'R',
-            'Pending Requirements': 'Q',
-            'Pending Verification': 'V',
-            'Pending Closure': 'Z',
-            'Pending Deploy': 'Y',  # Changed from W to Y
-            'Pending Merge': 'M',
-            'Wish List': 'W',  # New W for Wish List
-            'Accepted': 'A',
-            'Scheduled': 'S',
-            'Done': 'C',  # Use C for Closed/Done to free up D
-            'Closed': 'C',
-            'Deferred': 'D',  # Use D for Deferred (red)
-            'Abandoned': '_',  # Use _ for Abandoned (red)
-            'Blocked': 'X'
-        }
-        return status_map.get(status_name, '?')
+        return _STATUS_LETTERS.get(status_name, '?')
 
     def format_status_indicator(self, status_name: str, use_colors: bool) -> str:
         """Format status indicator with appropriate colors."""
-        letter = self.get_status_letter(status_name)
-
-        if use_colors:
-            if letter in ['C', 'V', 'Z', 'Y', 'M']:
-                return f'\033[32m[{letter}]\033[0m'  # Green for closed/done/verification/closure/deploy/merge
-            elif letter in ['A', 'B', 'S', 'W']:
-                return f'\033[34m[{letter}]\033[0m'  # Blue for accepted/backlog/scheduled/wishlist
-            elif letter in ['P', 'R', 'Q']:
-                return f'\033[33m[{letter}]\033[0m'  # Yellow for active/pending
-            elif letter in ['D', 'X', '_']:
-                return f'\033[31m[{letter}]\033[0m'  # Red for deferred/blocked/abandoned
-            elif letter == 'T':
-                return f'\033[33m[{letter}]\033[0m'  # Yellow for triage
-            else:
-                return f'[{letter}]'  # Standard for unknown
-        else:
-            return f'[{letter}]'
+        indicators = _STATUS_INDICATORS_COLOR if use_colors else _STATUS_INDICATORS_PLAIN
+        return indicators[_STATUS_LETTERS.get(status_name, '?')]
 
     def format_story_points(self, points) -> str:
         """Format story points as integer if whole number, otherwise float."""
@@ -342,31 +834,35 @@ class JiraUtils:
 
     def format_ticket_line(self, issue: dict, index: int, summary_length: int, use_colors: bool,
                           show_due_date_prefix: bool = False, show_sprint: bool = False,
-                          show_asterisk: bool = False, show_status: bool = True, sprint_name: str = None) -> str:
+                          show_asterisk: bool = False, show_status: bool = True, sprint_name: str = None,
+                          now: Optional[datetime] = None) -> str:
         """Format a complete ticket line with all standard information.
 
         Standard format: [state] KEY-123 (updated) [story pts, assignee if present] [DUE:if present] [P:priority]: Summary
+        now (UTC) is passed to calculate_days_since_update; callers formatting a list can read the clock once.
         """
         fields = issue.get('fields', {})
+        get = fields.get  # Bound once: this runs for every row of every dashboard
         key = issue.get('key', 'N/A')
 
         # Get basic fields
-        full_summary = fields.get('summary', 'No summary')
+        full_summary = get('summary', 'No summary')
         summary = full_summary[:summary_length]
         summary_suffix = '...' if len(full_summary) > summary_length else ''
 
-        priority = fields.get('priority', {}).get('name', 'No Priority')
-        status_name = fields.get('status', {}).get('name', 'Unknown')
-        status_category = fields.get('status', {}).get('statusCategory', {}).get('key', '')
-        assignee = fields.get('assignee')
+        priority = get('priority', {}).get('name', 'No Priority')
+        status = get('status', {})
+        status_name = status.get('name', 'Unknown')
+        status_category = status.get('statusCategory', {}).get('key', '')
+        assignee = get('assignee')
         assignee_name = self.get_assignee_name(assignee)
 
-        story_points = self.format_story_points(fields.get('customfield_10061'))
+        story_points = self.format_story_points(get('customfield_10061'))
 
         # Calculate days since update
-        updated_str = fields.get('updated', '')
-        days, days_text = self.calculate_days_since_update(updated_str)
-        days_part = self.format_days_with_color(days, days_text, use_colors)
+        updated_str = get('updated', '')
+        days, days_text = self.calculate_days_since_update(updated_str, now)
+        days_part = _format_days_with_color(days, days_text, use_colors)
 
         # Status indicator (always show for consistency)
         status_indicator = self.format_status_indicator(status_name, use_colors) if show_status else ''
@@ -374,16 +870,7 @@ class JiraUtils:
         # Due date prefix (for DUE SOON sections)
         due_date_prefix = ""
         if show_due_date_prefix:
-            due_date_str = fields.get('duedate', '')
-            if due_date_str:
-                try:
-                    due_date = datetime.strptime(due_date_str, '%Y-%m-%d')
-                    formatted_date = due_date.strftime('%Y-%m-%d')
-                    due_date_prefix = f'{formatted_date} '
-                except:
-                    due_date_prefix = '????-??-?? '
-            else:
-                due_date_prefix = '????-??-?? '
+            due_date_prefix = _format_due_date_prefix(get('duedate', ''))
 
         # Asterisk for tickets added after sprint start
         asterisk = ""
@@ -400,14 +887,14 @@ class JiraUtils:
             sprint_part = f'{sprint_info} ' if sprint_info else ''
 
         # Due date inline (if not shown as prefix)
-        due_date_field = fields.get('duedate', '')
+        due_date_field = get('duedate', '')
         due_part = f'[DUE:{due_date_field}] ' if due_date_field and not show_due_date_prefix else ''
 
         priority_part = f'[P:{priority}]'
 
         # Impediment flag
         impediment_flag = ''
-        flags = fields.get('customfield_10023', [])
+        flags = get('customfield_10023', [])
         if flags:
             flag_values = []
             for flag in flags:
@@ -436,9 +923,7 @@ class JiraUtils:
                 return '  '  # Space for alignment
 
             # Parse ticket creation date
-            if created_str.count(':') == 2 and ('+' in created_str[-5:] or '-' in created_str[-5:]):
-                created_str = created_str[:-2] + ':' + created_str[-2:]
-            created_dt = datetime.fromisoformat(created_str)
+            created_dt = _parse_jira_datetime(created_str)
 
             # Find the specified sprint or active sprint start date
             for sprint in sprints:
@@ -450,15 +935,10 @@ class JiraUtils:
                     start_date_str = sprint.get('startDate', '')
                     if start_date_str:
                         # Parse sprint start date
-                        if start_date_str.count(':') == 2 and ('+' in start_date_str[-5:] or '-' in start_date_str[-5:]):
-                            start_date_str = start_date_str[:-2] + ':' + start_date_str[-2:]
-                        elif start_date_str.endswith('Z'):
-                            start_date_str = start_date_str[:-1] + '+00:00'
-
-                        start_dt = datetime.fromisoformat(start_date_str)
+                        start_dt = _parse_jira_datetime(start_date_str)
 
                         # Check if created at least 1 day after sprint start
-                        time_diff = created_dt.astimezone(timezone.utc) - start_dt.astimezone(timezone.utc)
+                        time_diff = created_dt - start_dt
                         if time_diff.days >= 1:
                             return '\033[31m*\033[0m ' if use_colors else '* '
 
@@ -468,26 +948,7 @@ class JiraUtils:
 
     def sort_by_rank(self, issues: List[dict]) -> List[dict]:
         """Sort issues by Jira rank field (customfield_10022)."""
-        def get_rank_sort_key(issue):
-            fields = issue.get('fields', {})
-            rank = fields.get('customfield_10022', '')
-
-            if rank and '|' in rank and ':' in rank:
-                # Extract rank part after pipe: 'hzzwg1:000i'
-                rank_part = rank.split('|')[1]
-                if ':' in rank_part:
-                    prefix, suffix = rank_part.split(':', 1)
-                    # For Jira rank ordering, treat as pure string comparison
-                    # Jira's rank values are designed to sort lexicographically
-                    suffix_clean = suffix.rstrip(':')
-                    return (prefix, suffix_clean)
-
-            # Fallback to issue key for consistent ordering
-            issue_key = issue.get('key', 'ZZZZ-9999')
-            issue_num = issue_key.split('-')[-1] if '-' in issue_key else '9999'
-            return ('zzz_fallback', issue_num.zfill(10))
-
-        return sorted(issues, key=get_rank_sort_key)
+        return sorted(issues, key=_rank_sort_key)
 
     def rank_issues(self, issues: List[str], rank_before: str = None, rank_after: str = None,
                     rank_custom_field_id: int = 10022) -> Tuple[bool, str]:
@@ -589,12 +1050,11 @@ class JiraUtils:
                 print("[B] Backlog  [A] Accepted  [S] Scheduled  [W] Wish List  [T] Triage  [P] In Progress  [R] In Review  [Q] Requirements")
                 print("[C] Done  [V] Verification  [Y] Deploy  [M] Merge  [Z] Closure  [D] Deferred  [_] Abandoned  [X] Blocked")
 
-    def categorize_tickets_by_status(self, issues: List[dict]) -> Tuple[Dict[str, List[dict]], Dict[str, int]]:
+    def categorize_tickets_by_status(self, issues: Iterable[dict]) -> Tuple[Dict[str, List[dict]], Dict[str, int]]:
         """Categorize tickets by status and return both tickets and counts."""
         from collections import defaultdict
 
         categories = defaultdict(list)
-        status_counts = defaultdict(int)
 
         for issue in issues:
             fields = issue.get('fields', {})
@@ -602,29 +1062,13 @@ class JiraUtils:
             status_name = status_info.get('name', 'Unknown')
             status_category = status_info.get('statusCategory', {}).get('key', '')
 
-            # Categorize by status
-            if status_category == 'done' or status_name in ['Pending Verification', 'Abandoned']:
-                categories['done'].append(issue)
-                status_counts['done'] += 1
-            elif 'blocked' in status_name.lower():
-                categories['blocked'].append(issue)
-                status_counts['blocked'] += 1
-            elif status_category == 'new' or 'triage' in status_name.lower() or 'backlog' in status_name.lower():
-                categories['todo'].append(issue)
-                status_counts['todo'] += 1
-            elif status_category == 'indeterminate' or 'progress' in status_name.lower():
-                categories['in_progress'].append(issue)
-                status_counts['in_progress'] += 1
-            elif 'review' in status_name.lower():
-                categories['in_review'].append(issue)
-                status_counts['in_review'] += 1
-            else:
-                categories['other'].append(issue)
-                status_counts['other'] += 1
+            categories[_status_bucket(status_name, status_category)].append(issue)
 
-        return dict(categories), dict(status_counts)
+        # Counts are just the bucket sizes
+        status_counts = {bucket: len(tickets) for bucket, tickets in categories.items()}
+        return dict(categories), status_counts
 
-    def separate_by_triage_and_due_dates(self, issues: List[dict], days_threshold: int = 30) -> Tuple[List[dict], List[dict], List[dict]]:
+    def separate_by_triage_and_due_dates(self, issues: Iterable[dict], days_threshold: int = 30) -> Tuple[List[dict], List[dict], List[dict]]:
         """Separate issues into triage, due soon, and other categories."""
         triage_items = []
         due_soon_items = []
@@ -639,14 +1083,8 @@ class JiraUtils:
             due_date_str = fields.get('duedate', '')
 
             # Check if item has due date within threshold
-            has_upcoming_due_date = False
-            if due_date_str:
-                try:
-                    due_date = datetime.strptime(due_date_str, '%Y-%m-%d')
-                    if due_date <= threshold_date:
-                        has_upcoming_due_date = True
-                except:
-                    pass
+            due_date = _parse_due_date(due_date_str)
+            has_upcoming_due_date = due_date is not None and due_date <= threshold_date
 
             # Prioritize due dates over triage status
             if has_upcoming_due_date:
@@ -656,24 +1094,15 @@ class JiraUtils:
             else:
                 other_items.append(issue)
 
-        # Sort due soon items by due date
-        def get_due_date_sort_key(issue):
-            due_date_str = issue.get('fields', {}).get('duedate', '')
-            if due_date_str:
-                try:
-                    return datetime.strptime(due_date_str, '%Y-%m-%d')
-                except:
-                    return datetime.max
-            return datetime.max
-
-        due_soon_items.sort(key=get_due_date_sort_key)
+        # Sort due soon items by due date (all of them parsed above, so cache hits)
+        due_soon_items.sort(key=lambda issue: _parse_due_date(issue.get('fields', {}).get('duedate', '')))
 
         return triage_items, due_soon_items, other_items
 
     def add_common_arguments(self, parser, include_team: bool = True, include_count: bool = True,
                            default_count: int = 10, include_show_all: bool = False,
                            include_deferred: bool = False, include_done: bool = False,
-                           include_backlog_jql: bool = False):
+                           include_backlog_jql: bool = False, include_refresh: bool = False):
         """Add common command line arguments to argument parser."""
         if include_team:
             parser.add_argument('team', nargs='?', default='ciplat', help='Team name from config file (default: ciplat)')
@@ -698,22 +1127,23 @@ class JiraUtils:
         if include_backlog_jql:
             parser.add_argument('--backlog-jql', help='Custom JQL query for backlog items (overrides default project-based query)')
 
+        if include_refresh:
+            parser.add_argument('--refresh', action='store_true', help='Fetch fresh results instead of reusing ones cached in the last 5 minutes')
+
         if include_team:
             parser.add_argument('--list-teams', action='store_true', help='Show available teams from config file')
 
     def determine_colors(self, args) -> bool:
         """Determine if colors should be used based on arguments and environment."""
-        if hasattr(args, 'color') and args.color:
+        if getattr(args, 'color', False):
             return True
-        elif hasattr(args, 'no_color') and args.no_color:
+        elif getattr(args, 'no_color', False):
             return False
         else:
             return self.supports_colors()
 
     def load_team_config(self, team: str, config_file: Path) -> Dict[str, str]:
         """Load team configuration from config file."""
-        import configparser
-
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
 
@@ -728,8 +1158,6 @@ class JiraUtils:
 
     def list_teams(self, config_file: Path) -> None:
         """List all available teams from config file."""
-        import configparser
-
         if not config_file.exists():
             print(f"❌ Config file not found: {config_file}")
             return
@@ -819,13 +1247,12 @@ class JiraUtils:
             # Don't search with empty/short queries - returns external users
             return []
 
-        from urllib.parse import quote
         query_param = query.strip()
         query_encoded = quote(query_param)
 
         # Search with actual query (returns real users with email addresses)
         endpoint = f'/user/search?query={query_encoded}&maxResults=1000'
-        response = self.call_jira_api(endpoint)
+        response = self.call_jira_api(endpoint, cache_ttl=300)
 
         if not response or not isinstance(response, list):
             return []
@@ -868,7 +1295,7 @@ class JiraUtils:
             return self._current_user_id
 
         # Fetch from API
-        response = self.call_jira_api('/myself')
+        response = self.call_jira_api('/myself', cache_ttl=300)
         if not response or 'accountId' not in response:
             return None
 
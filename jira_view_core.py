@@ -19,6 +19,7 @@ Controllers:
 """
 
 from typing import List, Optional, Tuple, Callable, Dict, Any
+from concurrent.futures import Future
 from dataclasses import dataclass
 import threading
 import time
@@ -342,8 +343,9 @@ class TicketController:
             utils: JiraUtils instance (handles API calls and caching)
         """
         self.utils = utils
-        self.transitions_cache: Dict[str, List[dict]] = {}
-        self.transitions_lock = threading.Lock()
+        self.transitions_cache: Dict[str, List[dict]] = {}  # Single-key get/set are atomic under the GIL
+        self.transitions_lock = threading.Lock()  # Protects _transitions_inflight only
+        self._transitions_inflight: Dict[str, Future] = {}  # key -> fetch in progress
 
     def refresh_ticket(
         self,
@@ -422,7 +424,8 @@ class TicketController:
         """
         Fetch available status transitions for a ticket.
 
-        Thread Safety: Safe to call concurrently. Results are cached.
+        Thread Safety: Safe to call concurrently. Results are cached, and
+        concurrent calls for the same uncached ticket share one API request.
 
         Args:
             ticket_key: Ticket key (e.g., "PROJ-123")
@@ -435,36 +438,93 @@ class TicketController:
             >>> for t in transitions:
             ...     print(f"{t['name']} (id: {t['id']})")
         """
-        # Check cache first
+        # Check cache first (lock-free: a single dict lookup is atomic)
+        transitions = self.transitions_cache.get(ticket_key)
+        if transitions is not None:
+            return transitions
+
+        # Join a fetch already in flight for this ticket, or start one
         with self.transitions_lock:
-            if ticket_key in self.transitions_cache:
-                return self.transitions_cache[ticket_key]
+            future = self._transitions_inflight.get(ticket_key)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._transitions_inflight[ticket_key] = Future()
+        if not owner:
+            return future.result()
 
         # Fetch from API (NO LOCK during I/O)
+        transitions = None
         try:
             endpoint = f"/issue/{ticket_key}/transitions"
             response = self.utils.call_jira_api(endpoint)
 
-            if not response:
-                return None
-
-            transitions = response.get('transitions', [])
-
-            # Cache result
-            with self.transitions_lock:
+            if response:
+                transitions = response.get('transitions', [])
                 self.transitions_cache[ticket_key] = transitions
 
-            return transitions
-
         except Exception as e:
             print(f"Error fetching transitions for {ticket_key}: {e}")
-            return None
+        finally:
+            with self.transitions_lock:
+                del self._transitions_inflight[ticket_key]
+            future.set_result(transitions)
+
+        return transitions
+
+    def fetch_transitions_batch(self, ticket_keys: List[str], batch_size: int = 100) -> Dict[str, List[dict]]:
+        """
+        Fetch transitions for many tickets with `key in (...)` JQL searches.
+
+        Each search expands transitions for up to batch_size tickets, replacing
+        one /issue/{key}/transitions request per ticket. Keys already cached are
+        skipped; keys the search did not return are left for fetch_transitions().
+
+        Thread Safety: Safe to call concurrently. Results are cached.
+
+        Args:
+            ticket_keys: Ticket keys (e.g., ["PROJ-123", "PROJ-124"])
+            batch_size: Number of keys per JQL search (default 100, one page)
+
+        Returns:
+            Dict of ticket_key -> transitions for every key now cached
+
+        Examples:
+            >>> fetched = controller.fetch_transitions_batch(["TEST-1", "TEST-2"])
+            >>> missing = [k for k in ["TEST-1", "TEST-2"] if k not in fetched]
+        """
+        # Check cache first
+        cache = self.transitions_cache
+        fetched = {key: cache[key] for key in ticket_keys if key in cache}
+        to_fetch = [key for key in ticket_keys if key not in fetched]
+
+        # Fetch from API (NO LOCK during I/O)
+        for start in range(0, len(to_fetch), batch_size):
+            chunk = to_fetch[start:start + batch_size]
+            try:
+                issues = self.utils.fetch_all_jql_results(
+                    f"key in ({','.join(chunk)})", ['key'],
+                    max_items=len(chunk), expand='transitions', skip_count=True
+                )
+            except Exception as e:
+                print(f"Error fetching transitions for {len(chunk)} tickets: {e}")
+                continue
+
+            results = {issue['key']: issue.get('transitions', [])
+                       for issue in issues if issue.get('key') and 'transitions' in issue}
+
+            # Cache results (readers only ever look up single keys)
+            self.transitions_cache.update(results)
+            fetched.update(results)
+
+        return fetched
 
     def get_cached_transitions(self, ticket_key: str) -> Optional[List[dict]]:
         """
         Get cached transitions without API call.
 
-        Thread Safety: Thread-safe via lock.
+        Thread Safety: Lock-free; a single dict lookup is atomic.
 
         Args:
             ticket_key: Ticket key
@@ -472,8 +532,7 @@ class TicketController:
         Returns:
             Cached transitions or None
         """
-        with self.transitions_lock:
-            return self.transitions_cache.get(ticket_key)
+        return self.transitions_cache.get(ticket_key)
 
     def format_ticket_display(
         self,
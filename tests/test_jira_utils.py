@@ -0,0 +1,342 @@
+"""
+Tests for JiraUtils JQL paging and direct API retries.
+
+The paging tests run the real _iter_jql_pages, _collect_jql_keys and
+_fetch_issues_by_keys against a fake call_jira_api that serves /search/jql
+pages (GET by token, POST for key pages), including server page caps and
+Jira error bodies. The retry tests fake _api_request.
+"""
+
+import pytest
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeSearchApi:
+    """
+    Stand-in for JiraUtils.call_jira_api serving a fixed result set.
+
+    Args:
+        keys: Keys the query returns, in order
+        cap: Most issues returned per page, whatever maxResults asks for
+        missing: Keys whose key in (...) page fails with a Jira error body
+    """
+
+    def __init__(self, keys, cap=None, missing=()):
+        self.keys = list(keys)
+        self.cap = cap
+        self.missing = set(missing)
+        self.requests = []  # (method, maxResults, jql) per call
+
+    def __call__(self, endpoint, method="GET", data=None, cache_ttl=None):
+        if method == "POST":
+            params = dict(data)
+        else:
+            params = {name: values[0] for name, values in parse_qs(urlsplit(endpoint).query).items()}
+        jql = params['jql']
+        max_results = int(params['maxResults'])
+        self.requests.append((method, max_results, jql))
+
+        if jql.startswith('key in ('):
+            keys = jql[len('key in ('):-1].split(',')
+            if self.missing & set(keys):
+                return {'errorMessages': ["An issue with key does not exist"], 'errors': {}}
+        else:
+            keys = self.keys
+
+        start = int(params.get('nextPageToken') or 0)
+        count = min(max_results, self.cap or max_results)
+        page = keys[start:start + count]
+        response = {'issues': [{'key': key, 'fields': {}} for key in page]}
+        if start + count < len(keys):
+            response['nextPageToken'] = str(start + count)
+        return response
+
+
+def make_utils(api):
+    """JiraUtils with api as call_jira_api; bypasses __init__ (no config, no SQLite cache)."""
+    from jira_utils import JiraUtils
+
+    utils = JiraUtils.__new__(JiraUtils)
+    utils._jql_page_cap = None
+    utils._fetch_pool = None
+    utils._count_method = None
+    utils.call_jira_api = api
+    return utils
+
+
+def keys_of(issues):
+    return [issue['key'] for issue in issues]
+
+
+KEYS = [f'TEST-{i}' for i in range(1, 9)]
+
+
+class TestIterJqlResults:
+    """Tests for lazy page fetching in iter_jql_results."""
+
+    def test_no_request_until_iterated(self):
+        """Creating the iterator fetches nothing; the first issue fetches one page."""
+        api = FakeSearchApi(KEYS)
+        results = make_utils(api).iter_jql_results("project=TEST", ["key"], batch_size=2)
+
+        assert api.requests == []
+        assert next(results)['key'] == 'TEST-1'
+        assert len(api.requests) == 1
+
+    def test_stops_fetching_when_caller_stops(self):
+        """A caller taking the first 3 issues requests only the first 2 pages."""
+        api = FakeSearchApi(KEYS)
+        results = make_utils(api).iter_jql_results("project=TEST", ["key"], batch_size=2)
+
+        assert keys_of(islice(results, 3)) == ['TEST-1', 'TEST-2', 'TEST-3']
+        assert len(api.requests) == 2
+
+    def test_full_iteration_yields_all_issues(self):
+        """Consuming everything walks every page, in order."""
+        api = FakeSearchApi(KEYS)
+
+        issues = list(make_utils(api).iter_jql_results("project=TEST", ["key"], batch_size=2))
+
+        assert keys_of(issues) == KEYS
+        assert len(api.requests) == 4
+
+
+class TestIterJqlPages:
+    """Tests for the token walk's page-cap fallback."""
+
+    def test_shrinks_page_size_to_server_cap(self):
+        """A capped page lowers maxResults for the rest of the walk and is remembered."""
+        api = FakeSearchApi(KEYS, cap=3)
+        utils = make_utils(api)
+
+        pages = list(utils._iter_jql_pages("project=TEST", "key", None, 500))
+
+        assert [len(page) for page in pages] == [3, 3, 2]
+        assert [max_results for _, max_results, _ in api.requests] == [500, 3, 3]
+        assert utils._jql_page_cap == 3
+
+    def test_error_body_ends_walk(self):
+        """A Jira error body ends the walk without yielding a page."""
+        utils = make_utils(lambda *args, **kwargs: {'errorMessages': ["Bad JQL"]})
+
+        assert list(utils._iter_jql_pages("bad", "key", None, 500)) == []
+
+
+class TestCollectJqlKeys:
+    """Tests for the key-only walk and its interrupted/complete flags."""
+
+    def test_complete_walk(self):
+        """All keys come back in order, uninterrupted and complete."""
+        utils = make_utils(FakeSearchApi(KEYS, cap=3))
+
+        assert utils._collect_jql_keys("project=TEST") == (KEYS, False, True)
+
+    @pytest.mark.parametrize("failure", [None, {'errorMessages': ["Rate limited"]}])
+    def test_failed_page_is_incomplete(self, failure):
+        """A failed call or error body on a later page keeps the keys so far, marked incomplete."""
+        api = FakeSearchApi(KEYS, cap=3)
+
+        def flaky(endpoint, method="GET", data=None, cache_ttl=None):
+            return failure if 'nextPageToken=3' in endpoint else api(endpoint, method, data)
+
+        keys, interrupted, complete = make_utils(flaky)._collect_jql_keys("project=TEST")
+
+        assert (keys, interrupted, complete) == (KEYS[:3], False, False)
+
+    def test_keypress_interrupts(self):
+        """A key pressed between pages stops the walk with the keys counted so far."""
+        api = FakeSearchApi(KEYS, cap=3)
+
+        class Screen:
+            def __init__(self):
+                self.polls = 0
+
+            def nodelay(self, flag):
+                pass
+
+            def getch(self):
+                self.polls += 1
+                return ord('x') if self.polls == 2 else -1
+
+            def clear(self):
+                pass
+
+            def addstr(self, *args):
+                pass
+
+            def refresh(self):
+                pass
+
+        keys, interrupted, complete = make_utils(api)._collect_jql_keys("project=TEST", Screen())
+
+        assert (keys, interrupted, complete) == (KEYS[:3], True, False)
+
+
+class TestFetchIssuesByKeys:
+    """Tests for parallel key-page fetching, ordering and failure truncation."""
+
+    def test_pages_posted_and_returned_in_key_order(self):
+        """Key pages are POSTed and the issues come back in the order of keys."""
+        api = FakeSearchApi(KEYS)
+        keys = list(reversed(KEYS))
+
+        issues, complete = make_utils(api)._fetch_issues_by_keys(keys, ["summary"], None, None, len(keys), 2)
+
+        assert complete
+        assert keys_of(issues) == keys
+        assert len(api.requests) == 4
+        assert all(method == "POST" for method, _, _ in api.requests)
+
+    def test_capped_page_follows_token(self):
+        """A key page capped by the server picks up the rest of that page by token."""
+        api = FakeSearchApi(KEYS, cap=3)
+        utils = make_utils(api)
+
+        issues, complete = utils._fetch_issues_by_keys(KEYS, ["summary"], None, None, len(KEYS), 4)
+
+        assert complete
+        assert keys_of(issues) == KEYS
+        assert utils._jql_page_cap == 3
+
+    def test_error_page_truncates(self):
+        """An error body on a page returns only the pages before it, marked incomplete."""
+        api = FakeSearchApi(KEYS, missing=['TEST-3'])
+
+        issues, complete = make_utils(api)._fetch_issues_by_keys(KEYS, ["summary"], None, None, len(KEYS), 2)
+
+        assert not complete
+        assert keys_of(issues) == ['TEST-1', 'TEST-2']
+
+    def test_public_wrapper_reports_failure(self):
+        """fetch_issues_by_keys returns None rather than a partial list."""
+        api = FakeSearchApi(KEYS, missing=['TEST-3'])
+        utils = make_utils(api)
+
+        assert utils.fetch_issues_by_keys(KEYS, ["summary"], batch_size=2) is None
+        assert keys_of(utils.fetch_issues_by_keys(KEYS[4:], ["summary"], batch_size=2)) == KEYS[4:]
+
+    def test_progress_reported(self):
+        """The progress callback ends at (all fetched, total)."""
+        progress = []
+        utils = make_utils(FakeSearchApi(KEYS))
+
+        utils.fetch_issues_by_keys(KEYS, ["summary"], progress_callback=lambda *args: progress.append(args),
+                                   batch_size=2)
+
+        assert len(progress) == 4
+        assert progress[-1] == (8, 8)
+
+
+class TestFetchAllJqlResults:
+    """Tests for fetch_all_jql_results combining the key walk and page fetches."""
+
+    def test_fetches_key_pages_in_parallel(self):
+        """After the key walk, full issues come from POSTed key pages."""
+        api = FakeSearchApi(KEYS)
+
+        issues = make_utils(api).fetch_all_jql_results("project=TEST", ["summary"], batch_size=2)
+
+        assert keys_of(issues) == KEYS
+        assert [method for method, _, _ in api.requests] == ["GET"] + ["POST"] * 4
+
+    def test_error_page_falls_back_to_token_walk(self):
+        """A failed key page doesn't drop issues: the query is walked by token instead."""
+        api = FakeSearchApi(KEYS, missing=['TEST-3'])
+
+        issues = make_utils(api).fetch_all_jql_results("project=TEST", ["summary"], batch_size=2)
+
+        assert keys_of(issues) == KEYS
+        assert api.requests[-1][0] == "GET"
+
+
+class TestGetJqlCount:
+    """Tests for get_jql_count's endpoint probing."""
+
+    def test_approximate_count(self):
+        """Jira Cloud answers from /search/approximate-count."""
+        calls = []
+
+        def api(endpoint, method="GET", data=None, cache_ttl=None):
+            calls.append(endpoint)
+            return {'count': 42}
+
+        utils = make_utils(api)
+
+        assert utils.get_jql_count("project=TEST") == (42, False)
+        assert calls == ['/search/approximate-count']
+
+    def test_server_fallback_remembered(self):
+        """Without approximate-count, maxResults=0 search is used and remembered."""
+        calls = []
+
+        def api(endpoint, method="GET", data=None, cache_ttl=None):
+            calls.append(endpoint.split('?')[0])
+            if endpoint.startswith('../2/search'):
+                return {'total': 17, 'issues': []}
+            return {'errorMessages': ["Not found"]}
+
+        utils = make_utils(api)
+
+        assert utils.get_jql_count("project=TEST") == (17, False)
+        assert utils.get_jql_count("project=TEST") == (17, False)
+        assert calls == ['/search/approximate-count', '../2/search', '../2/search']
+
+
+class TestApiRetries:
+    """Tests for retrying direct API calls on 429 and gateway errors."""
+
+    @pytest.fixture
+    def direct_utils(self, monkeypatch):
+        """JiraUtils on the direct path with _api_request replaced; returns (utils, responses, sleeps)."""
+        import jira_utils
+
+        sleeps = []
+        monkeypatch.setattr(jira_utils.time, 'sleep', sleeps.append)
+        utils = make_utils(None)
+        del utils.call_jira_api
+        utils._api_headers = {}
+        utils._api_response_cache = {}
+        responses = []
+        utils._api_request = lambda method, endpoint, body: responses.pop(0)
+        return utils, responses, sleeps
+
+    def test_gateway_error_retried_with_backoff(self, direct_utils):
+        """A GET 503 is retried with doubling backoff until it succeeds."""
+        utils, responses, sleeps = direct_utils
+        responses.extend([(503, b'', None), (503, b'', None), (200, b'{"ok": 1}', None)])
+
+        assert utils.call_jira_api('/myself') == {'ok': 1}
+        assert sleeps == [utils._API_BACKOFF, utils._API_BACKOFF * 2]
+
+    def test_retry_after_honored_and_capped(self, direct_utils):
+        """A 429's Retry-After sets the wait, capped at _MAX_RETRY_AFTER."""
+        utils, responses, sleeps = direct_utils
+        responses.extend([(429, b'', '2'), (429, b'', '3600'), (200, b'{}', None)])
+
+        assert utils.call_jira_api('/issue/TEST-1', method='PUT', data={}) == {}
+        assert sleeps == [2.0, utils._MAX_RETRY_AFTER]
+
+    def test_write_not_retried_on_gateway_error(self, direct_utils):
+        """A POST that may have been applied is not retried on 503."""
+        utils, responses, sleeps = direct_utils
+        responses.extend([(503, b'{"errorMessages": ["Unavailable"]}', None)])
+
+        assert utils.call_jira_api('/issue', method='POST', data={}) == {'errorMessages': ["Unavailable"]}
+        assert sleeps == []
+
+    def test_search_post_retried_on_gateway_error(self, direct_utils):
+        """A read-only POST /search/jql is retried on 503 like a GET."""
+        utils, responses, sleeps = direct_utils
+        responses.extend([(503, b'', None), (200, b'{"issues": []}', None)])
+
+        assert utils.call_jira_api('/search/jql', method='POST', data={}) == {'issues': []}
+        assert len(sleeps) == 1
+
+    def test_gives_up_after_retries(self, direct_utils):
+        """After _API_RETRIES retries the last response is returned."""
+        utils, responses, sleeps = direct_utils
+        responses.extend([(503, b'{"errorMessages": ["Unavailable"]}', None)] * (utils._API_RETRIES + 1))
+
+        assert utils.call_jira_api('/myself') == {'errorMessages': ["Unavailable"]}
+        assert len(sleeps) == utils._API_RETRIES
@@ -397,6 +397,62 @@ class TestTicketController:
         assert transitions2 == transitions
         assert not mock_jira_utils.call_jira_api.called, "Should have used cache"
 
+    def test_fetch_transitions_concurrent_single_request(self, ticket_controller, mock_jira_utils):
+        """
+        Verify concurrent fetch_transitions calls for one ticket share one API request.
+        """
+        release = threading.Event()
+
+        def slow_api(endpoint):
+            release.wait(timeout=5)
+            return {'transitions': [{'id': '21', 'name': 'In Progress'}]}
+
+        mock_jira_utils.call_jira_api.side_effect = slow_api
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(ticket_controller.fetch_transitions("TEST-123")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)  # Let every thread reach the in-flight fetch
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == [[{'id': '21', 'name': 'In Progress'}]] * 5
+        assert mock_jira_utils.call_jira_api.call_count == 1
+
+    def test_fetch_transitions_batch(self, ticket_controller, mock_jira_utils):
+        """
+        Verify fetch_transitions_batch uses one search per batch and caches results.
+        """
+        mock_jira_utils.fetch_all_jql_results.return_value = [
+            {'key': 'TEST-1', 'transitions': [{'id': '21', 'name': 'In Progress'}]},
+            {'key': 'TEST-2', 'transitions': []},
+        ]
+
+        fetched = ticket_controller.fetch_transitions_batch(["TEST-1", "TEST-2", "TEST-3"])
+
+        assert fetched == {
+            'TEST-1': [{'id': '21', 'name': 'In Progress'}],
+            'TEST-2': [],
+        }
+        assert mock_jira_utils.fetch_all_jql_results.call_count == 1
+        jql = mock_jira_utils.fetch_all_jql_results.call_args[0][0]
+        assert jql == "key in (TEST-1,TEST-2,TEST-3)"
+        assert mock_jira_utils.fetch_all_jql_results.call_args[1]['expand'] == 'transitions'
+
+        # Cached keys are not searched again; the missing key is
+        mock_jira_utils.fetch_all_jql_results.reset_mock()
+        mock_jira_utils.fetch_all_jql_results.return_value = []
+        ticket_controller.fetch_transitions_batch(["TEST-1", "TEST-3"])
+
+        jql = mock_jira_utils.fetch_all_jql_results.call_args[0][0]
+        assert jql == "key in (TEST-3)"
+        assert ticket_controller.get_cached_transitions("TEST-1") == [{'id': '21', 'name': 'In Progress'}]
+
     def test_get_cached_transitions(self, ticket_controller):
         """
         Verify get_cached_transitions returns None when not cached.